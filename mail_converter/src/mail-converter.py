@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 # 2024-04-21 (c) toriR Lab.
-# AppleScriptで選択されたメールを保存されたファイルをnkfでUTF-8に変換する
+# AppleScriptで選択されたメールを保存されたファイルをUTF-8に変換する
 
 import os
 import sys
@@ -9,33 +9,69 @@ import argparse
 import subprocess
 from datetime import datetime
 import re
-import glob
+import functools
+from email.parser import HeaderParser
+from email.policy import default
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+# 試行する文字コード（AppleScriptの保存形式はShift_JISが多い）
+CANDIDATE_ENCODINGS = ['utf-8', 'cp932', 'euc_jp', 'iso-2022-jp']
+
+# ファイル名に使用できない文字（括弧類を含む）・スペース・ハイフンの連続
+_SUBJECT_SEPARATOR_RE = re.compile(r'[\\/*?:"<>|()\[\]{} -]+')
+
+# AppleScriptの日付形式（曜日はどの表記でも読み飛ばす）
+_JP_DATE_RE = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日\s*\S+\s+(\d{1,2}):(\d{2}):(\d{2})')
+
+def _replace_subject_separator(match):
+    """特殊文字のみの連続は削除、スペースかハイフンを含む連続はハイフン1つにする"""
+    run = match.group()
+    return '-' if (' ' in run or '-' in run) else ''
 
 def parse_japanese_date(date_str):
-    """日本語の日付文字列を解析する"""
-    # 曜日の日本語名を英語に変換する辞書
-    weekdays = {
-        '月曜日': 'Monday',
-        '火曜日': 'Tuesday',
-        '水曜日': 'Wednesday',
-        '木曜日': 'Thursday',
-        '金曜日': 'Friday',
-        '土曜日': 'Saturday',
-        '日曜日': 'Sunday'
-    }
-    
-    # 曜日を英語に変換
-    for jp, en in weekdays.items():
-        date_str = date_str.replace(jp, en)
-    
+    """日本語の日付文字列を解析する（例: 2024年4月21日 日曜日 10:05:09）"""
+    match = _JP_DATE_RE.match(date_str)
+    if not match:
+        return None
+
     try:
-        # 日付を解析
-        date_obj = datetime.strptime(date_str, '%Y年%m月%d日 %A %H:%M:%S')
-        return date_obj
+        return datetime(*map(int, match.groups()))
     except ValueError:
         return None
 
-def convert_to_utf8(input_file, output_dir):
+def decode_mail_bytes(raw):
+    """メールのバイト列を文字コードを判定して文字列に変換する"""
+    encodings = CANDIDATE_ENCODINGS
+    # エスケープシーケンスを含む場合はISO-2022-JPを優先（ASCIIとしても読めてしまうため）
+    if b'\x1b$' in raw:
+        encodings = ['iso-2022-jp'] + [e for e in encodings if e != 'iso-2022-jp']
+
+    for encoding in encodings:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(raw).best()
+        if best is not None:
+            return str(best)
+
+    raise UnicodeDecodeError('unknown', raw, 0, len(raw), '文字コードを判定できませんでした')
+
+def decode_with_nkf(input_file):
+    """nkfコマンドでUTF-8に変換する（--use-nkf指定時のみ）"""
+    result = subprocess.run(['nkf', '-w', input_file], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"nkfコマンドの実行に失敗しました: {result.stderr}")
+    return result.stdout
+
+def convert_to_utf8(input_file, output_dir, use_nkf=False):
     """メールファイルをUTF-8に変換し、日付をファイル名に追加する"""
     try:
         # 入力ファイルの存在確認
@@ -46,23 +82,22 @@ def convert_to_utf8(input_file, output_dir):
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        # ファイルの内容を読み込み
-        with open(input_file, 'rb') as f:
-            content = f.read()
-
-        # nkfコマンドでUTF-8に変換
-        result = subprocess.run(['nkf', '-w', input_file], capture_output=True, text=True)
-        if result.returncode != 0:
-            raise Exception(f"nkfコマンドの実行に失敗しました: {result.stderr}")
+        # ファイルの内容を読み込み、UTF-8の文字列に変換
+        if use_nkf:
+            text = decode_with_nkf(input_file)
+        else:
+            with open(input_file, 'rb') as f:
+                raw = f.read()
+            text = decode_mail_bytes(raw)
 
-        # ヘッダー情報を抽出
-        content_lines = result.stdout.split('\n')
-        date_line = next((line for line in content_lines if line.startswith('Date: ')), None)
-        subject_line = next((line for line in content_lines if line.startswith('Subject: ')), None)
+        # ヘッダー部分のみを解析（本文は行分割しない。MIMEエンコードされた件名もデコードされる）
+        headers = HeaderParser(policy=default).parsestr(text, headersonly=True)
+        date_header = headers['Date']
+        subject_header = headers['Subject']
 
         # 日付情報を抽出
-        if date_line:
-            date_str = date_line.replace('Date: ', '').strip()
+        if date_header:
+            date_str = str(date_header).strip()
             date_obj = parse_japanese_date(date_str)
             if date_obj:
                 # 日付をYYMMDD_HHMMSS形式で出力
@@ -74,13 +109,10 @@ def convert_to_utf8(input_file, output_dir):
             formatted_date = datetime.now().strftime('%y%m%d_%H%M%S')
 
         # 件名を抽出して整形
-        if subject_line:
-            subject = subject_line.replace('Subject: ', '').strip()
-            # 特殊文字を除去し、スペースをハイフンに置換
-            safe_subject = re.sub(r'[\\/*?:"<>|()\[\]{}]', '', subject)  # 括弧類も除去
-            safe_subject = safe_subject.replace(' ', '-')
-            # 連続するハイフンを1つに
-            safe_subject = re.sub(r'-+', '-', safe_subject)
+        if subject_header:
+            subject = str(subject_header).strip()
+            # 特殊文字（括弧類も含む）を除去し、スペース・ハイフンの連続を1つのハイフンにする（1パスで処理）
+            safe_subject = _SUBJECT_SEPARATOR_RE.sub(_replace_subject_separator, subject)
             # 先頭と末尾のハイフンを除去
             safe_subject = safe_subject.strip('-')
             # 20文字に制限
@@ -93,7 +125,7 @@ def convert_to_utf8(input_file, output_dir):
         output_path = os.path.join(output_dir, new_filename)
 
         # 改行を統一（CRLFをLFに変換）
-        content = result.stdout.replace('\r\n', '\n').replace('\r', '\n')
+        content = text.replace('\r\n', '\n').replace('\r', '\n')
 
         # 変換した内容を保存
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -106,22 +138,31 @@ def convert_to_utf8(input_file, output_dir):
         print(f"エラーが発生しました: {str(e)}", file=sys.stderr)
         return False
 
-def process_directory(input_dir, output_dir):
+def process_directory(input_dir, output_dir, use_nkf=False, jobs=None):
     """ディレクトリ内のすべてのテキストファイルを処理する"""
-    if not os.path.exists(input_dir):
+    # テキストファイルを検索（scandirのDirEntryはstat情報をキャッシュしている）
+    try:
+        with os.scandir(input_dir) as it:
+            txt_files = [entry.path for entry in it if entry.name.endswith('.txt') and entry.is_file()]
+    except FileNotFoundError:
         print(f"入力ディレクトリが見つかりません: {input_dir}", file=sys.stderr)
         return False
-
-    # テキストファイルを検索
-    txt_files = glob.glob(os.path.join(input_dir, "*.txt"))
     if not txt_files:
         print(f"テキストファイルが見つかりません: {input_dir}", file=sys.stderr)
         return False
 
-    success_count = 0
-    for txt_file in txt_files:
-        if convert_to_utf8(txt_file, output_dir):
-            success_count += 1
+    # 出力ディレクトリは並列実行前に作成しておく
+    os.makedirs(output_dir, exist_ok=True)
+
+    # ファイルごとの変換は独立しているためプロセス並列で実行
+    convert = functools.partial(convert_to_utf8, output_dir=output_dir, use_nkf=use_nkf)
+    if jobs == 1 or len(txt_files) == 1:
+        results = [convert(txt_file) for txt_file in txt_files]
+    else:
+        max_workers = min(len(txt_files), jobs or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(convert, txt_files))
+    success_count = sum(results)
 
     print(f"\n処理完了: {success_count}/{len(txt_files)} ファイルを変換しました")
     return success_count > 0
@@ -130,6 +171,8 @@ def main():
     parser = argparse.ArgumentParser(description='メールファイルをUTF-8に変換し、日付をファイル名に追加します')
     parser.add_argument('-i', '--input-dir', required=True, help='入力ディレクトリのパス')
     parser.add_argument('-o', '--output-dir', help='出力ディレクトリのパス（デフォルト: 入力ディレクトリ内のexport-mail）')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='並列処理数（デフォルト: CPUコア数）')
+    parser.add_argument('--use-nkf', action='store_true', help='文字コード変換にnkfコマンドを使用する（自動判定に失敗する場合）')
 
     args = parser.parse_args()
 
@@ -137,7 +180,7 @@ def main():
     if args.output_dir is None:
         args.output_dir = os.path.join(args.input_dir, 'export-mail')
 
-    if not process_directory(args.input_dir, args.output_dir):
+    if not process_directory(args.input_dir, args.output_dir, args.use_nkf, args.jobs):
         sys.exit(1)
 
 if __name__ == '__main__':
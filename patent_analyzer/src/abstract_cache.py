@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Abstract Cache - 取得済みアブストラクトのキャッシュDB（SQLite）
+
+PatentDataFetcherが書き込み、AbstractIntegratorが読み込む唯一の保存先です。
+DB導入前の個別ファイル（<abstracts_dir>/<特許ID>.json）は移行用の入力としてのみ扱い、
+同じ特許IDの行がDBにあればDBの内容を優先します。
+特定の特許を再取得させる場合はDBの該当行（またはDBファイル自体）を削除してください。
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# アブストラクトキャッシュDBのファイル名（abstracts_dir直下に作成）
+CACHE_DB_NAME = "abstracts.sqlite3"
+
+
+def loads(raw) -> Any:
+    """JSON文字列/バイト列を読み込み（orjsonが利用可能ならorjsonを使用）"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def dumps(data: Any) -> str:
+    """キャッシュDB格納用にJSON文字列へ変換（orjsonが利用可能ならorjsonを使用）"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False)
+
+def cache_db_path(abstracts_dir: str) -> str:
+    """アブストラクトディレクトリに対応するキャッシュDBのパス"""
+    return os.path.join(str(abstracts_dir), CACHE_DB_NAME)
+
+def open_cache_db(abstracts_dir: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    キャッシュDBを開く（存在しなければテーブルごと作成）
+
+    Args:
+        abstracts_dir: アブストラクトディレクトリ
+        check_same_thread: Falseの場合は複数スレッドから使用可能（呼び出し側でロックすること）
+
+    Returns:
+        sqlite3.Connection: 自動コミットモードの接続
+    """
+    db = sqlite3.connect(cache_db_path(abstracts_dir), isolation_level=None,
+                         check_same_thread=check_same_thread)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("CREATE TABLE IF NOT EXISTS abstracts(id TEXT PRIMARY KEY, data TEXT)")
+    return db
+
+def load_cached_abstracts(abstracts_dir: str) -> Dict[str, Dict]:
+    """
+    キャッシュDBの全アブストラクトを読み込み
+
+    Args:
+        abstracts_dir: アブストラクトディレクトリ
+
+    Returns:
+        Dict[str, Dict]: 特許IDをキーとしたアブストラクトデータ（DBがなければ空）
+    """
+    if not os.path.isfile(cache_db_path(abstracts_dir)):
+        return {}
+    db = open_cache_db(abstracts_dir)
+    try:
+        return {patent_id: loads(data) for patent_id, data in db.execute("SELECT id, data FROM abstracts")}
+    finally:
+        db.close()
@@ -3,17 +3,78 @@
 """
 Abstract Integrator - CSV特許データとJSONアブストラクトデータを統合するコンポーネント
 
-jqを使用してCSVからJSONへの変換とアブストラクトデータの統合を行います。
+CSVからJSONへの変換とアブストラクトデータの統合をPython内で行います。
+アブストラクトは特許IDをキーとした辞書で突き合わせます（外部コマンド不要）。
 オーケストレーションプログラムから呼び出されることを想定しています。
 """
 
+import csv
 import json
-import subprocess
+import os
 import sys
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from abstract_cache import load_cached_abstracts
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# CSVの列に対応するJSONのフィールド名（Google Patentsのエクスポート形式）
+CSV_FIELDS = [
+    "id",
+    "title",
+    "assignee",
+    "inventors",
+    "priority_date",
+    "filing_date",
+    "publication_date",
+    "grant_date",
+    "result_link"
+]
+
+# アブストラクト個別ファイル読み込みの並列数
+ABSTRACT_LOAD_WORKERS = 32
+
+def _read_json(path) -> Any:
+    """JSONファイルを読み込み（orjsonが利用可能ならorjsonを使用）"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _write_json(path, data: Any, indent: bool = True):
+    """JSONファイルに書き込み（orjsonが利用可能ならorjsonを使用）"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+def _write_json_stream(path, records: Iterable[Dict]):
+    """レコードを1件ずつ書き出してJSON配列を作成（全件をメモリに保持しない）"""
+    with open(path, 'wb') as f:
+        f.write(b'[')
+        for i, record in enumerate(records):
+            if i:
+                f.write(b',')
+            if orjson is not None:
+                f.write(orjson.dumps(record))
+            else:
+                f.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+        f.write(b']')
+
+def _load_abstract_file(abstract_file: str) -> Tuple[str, Optional[Dict], Optional[Exception]]:
+    """アブストラクト個別ファイルを読み込み（スレッドプールから呼び出される）"""
+    try:
+        return abstract_file, _read_json(abstract_file), None
+    except Exception as e:
+        return abstract_file, None, e
 
 class AbstractIntegrator:
     """CSV特許データとJSONアブストラクトデータを統合するクラス"""
@@ -27,24 +88,21 @@ class AbstractIntegrator:
         """
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
-        
-        # jqの存在確認
-        self._check_jq_availability()
     
-    def _check_jq_availability(self) -> bool:
-        """jqが利用可能かチェック"""
-        try:
-            result = subprocess.run(['jq', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                self.logger.info(f"jq version: {result.stdout.strip()}")
-                return True
-            else:
-                self.logger.error("jq is not available")
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            self.logger.error("jq command not found. Please install jq.")
-            return False
+    def _iter_csv_records(self, csv_file: str) -> Iterator[Dict]:
+        """CSVファイルを1行ずつ読み込み、固定フィールドの辞書を順に返す"""
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            for row in reader:
+                # 先頭の検索URL行とヘッダー行をスキップ
+                if not row or not row[0] or row[0] == "id" or row[0].startswith("search URL"):
+                    continue
+                row = row + [""] * (len(CSV_FIELDS) - len(row))
+                yield dict(zip(CSV_FIELDS, row))
+    
+    def _csv_to_records(self, csv_file: str) -> List[Dict]:
+        """CSVファイルを読み込み、固定フィールドの辞書のリストに変換"""
+        return list(self._iter_csv_records(csv_file))
     
     def csv_to_json(self, csv_file: str, output_file: str) -> bool:
         """
@@ -58,123 +116,131 @@ class AbstractIntegrator:
             bool: 成功時True、失敗時False
         """
         try:
-            # jqコマンドでCSVをJSONに変換
-            jq_script = '''
-            split("\n") | .[1:-1] | map(split(",")) | map({
-              "id": .[0],
-              "title": .[1],
-              "assignee": .[2],
-              "inventors": .[3],
-              "priority_date": .[4],
-              "filing_date": .[5],
-              "publication_date": .[6],
-              "grant_date": .[7],
-              "result_link": .[8]
-            })
-            '''
+            # 全件をリストに展開せず、1件ずつJSON配列として書き出す
+            _write_json_stream(output_file, self._iter_csv_records(csv_file))
             
-            cmd = ['jq', '-R', '-s', '-c', jq_script]
-            
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                result = subprocess.run(cmd, input=f.read(), 
-                                      capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                # 結果をファイルに保存
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(result.stdout)
-                
-                self.logger.info(f"CSV to JSON conversion completed: {output_file}")
-                return True
-            else:
-                self.logger.error(f"jq conversion failed: {result.stderr}")
-                return False
+            self.logger.info(f"CSV to JSON conversion completed: {output_file}")
+            return True
                 
         except Exception as e:
             self.logger.error(f"CSV to JSON conversion error: {e}")
             return False
     
+    def _load_abstracts(self, abstracts_dir: str) -> Dict[str, Dict]:
+        """
+        アブストラクトを読み込み、特許IDをキーとした辞書を返す
+        
+        PatentDataFetcherのキャッシュDBを正とし、DBにない特許のみ
+        DB導入前の個別ファイル（<特許ID>.json）から補う。
+        """
+        abstracts = {}
+        
+        # ディレクトリを1回走査してファイル一覧を取得（存在しない場合は空）
+        try:
+            with os.scandir(abstracts_dir) as it:
+                abstract_files = [entry.path for entry in it if entry.name.endswith(".json") and entry.is_file()]
+        except FileNotFoundError:
+            abstract_files = []
+        
+        # 小さなファイルの読み込みはI/O待ちが支配的なためスレッドで並列化
+        with ThreadPoolExecutor(max_workers=ABSTRACT_LOAD_WORKERS) as executor:
+            for abstract_file, abstract_data, error in executor.map(_load_abstract_file, abstract_files):
+                if error is None:
+                    patent_id = os.path.basename(abstract_file)[:-len(".json")]
+                    abstracts[patent_id] = abstract_data
+                else:
+                    self.logger.warning(f"Failed to load abstract file {abstract_file}: {error}")
+        
+        file_count = len(abstracts)
+        
+        # キャッシュDBの内容で上書き（同じ特許IDはDBを優先）
+        try:
+            cached_abstracts = load_cached_abstracts(abstracts_dir)
+        except Exception as e:
+            self.logger.warning(f"Failed to load abstract cache DB in {abstracts_dir}: {e}")
+            cached_abstracts = {}
+        abstracts.update(cached_abstracts)
+        
+        self.logger.info(f"Loaded {len(abstracts)} abstracts from {abstracts_dir} "
+                         f"({len(cached_abstracts)} from cache DB, {file_count} abstract files)")
+        return abstracts
+    
+    def _integrate(self, patents: List[Dict], abstracts_dir: str) -> List[Dict]:
+        """特許データのリストにキャッシュDBのアブストラクトを統合（DBにない特許のみDB導入前の個別ファイルから補う）"""
+        abstracts = self._load_abstracts(abstracts_dir)
+        
+        integrated_patents = []
+        for patent in patents:
+            patent_id = patent.get("id")
+            integrated_patent = patent.copy()
+            
+            if patent_id in abstracts:
+                abstract_data = abstracts[patent_id]
+                integrated_patent.update({
+                    "abstract": abstract_data.get("Abstract"),
+                    "abstract_title": abstract_data.get("Title"),
+                    "abstract_url": abstract_data.get("URL"),
+                    "abstract_error": abstract_data.get("Error"),
+                    "abstract_retry_count": abstract_data.get("RetryCount", 0),
+                    "abstract_source": "integrated_from_file"
+                })
+            else:
+                # アブストラクトファイルが存在しない場合
+                integrated_patent.update({
+                    "abstract": None,
+                    "abstract_title": None,
+                    "abstract_url": None,
+                    "abstract_error": "Abstract file not found",
+                    "abstract_retry_count": 0,
+                    "abstract_source": "not_found"
+                })
+            
+            integrated_patents.append(integrated_patent)
+        
+        return integrated_patents
+    
     def integrate_abstracts(self, patents_file: str, abstracts_dir: str, 
-                          output_file: str) -> bool:
+                          output_file: str) -> Optional[Tuple[int, int]]:
         """
         特許データと個別アブストラクトファイルを統合
         
         Args:
             patents_file: 特許データJSONファイルパス
-            abstracts_dir: アブストラクト個別ファイルディレクトリパス
+            abstracts_dir: アブストラクトのキャッシュDB（および旧形式の個別ファイル）のディレクトリパス
             output_file: 出力JSONファイルパス
             
         Returns:
-            bool: 成功時True、失敗時False
+            Optional[Tuple[int, int]]: 成功時（処理件数, アブストラクト有り件数）、失敗時None
         """
         try:
             # 特許データを読み込み
-            with open(patents_file, 'r', encoding='utf-8') as f:
-                patents = json.load(f)
-            
-            # 個別アブストラクトファイルを読み込み
-            abstracts_dir_path = Path(abstracts_dir)
-            abstracts = {}
-            
-            if abstracts_dir_path.exists():
-                for abstract_file in abstracts_dir_path.glob("*.json"):
-                    patent_id = abstract_file.stem
-                    try:
-                        with open(abstract_file, 'r', encoding='utf-8') as f:
-                            abstract_data = json.load(f)
-                        abstracts[patent_id] = abstract_data
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load abstract file {abstract_file}: {e}")
+            patents = _read_json(patents_file)
             
-            # 特許データとアブストラクトを統合
-            integrated_patents = []
-            for patent in patents:
-                patent_id = patent.get("id")
-                integrated_patent = patent.copy()
-                
-                if patent_id in abstracts:
-                    abstract_data = abstracts[patent_id]
-                    integrated_patent.update({
-                        "abstract": abstract_data.get("Abstract"),
-                        "abstract_title": abstract_data.get("Title"),
-                        "abstract_url": abstract_data.get("URL"),
-                        "abstract_error": abstract_data.get("Error"),
-                        "abstract_retry_count": abstract_data.get("RetryCount", 0),
-                        "abstract_source": "integrated_from_file"
-                    })
-                else:
-                    # アブストラクトファイルが存在しない場合
-                    integrated_patent.update({
-                        "abstract": None,
-                        "abstract_title": None,
-                        "abstract_url": None,
-                        "abstract_error": "Abstract file not found",
-                        "abstract_retry_count": 0,
-                        "abstract_source": "not_found"
-                    })
-                
-                integrated_patents.append(integrated_patent)
+            integrated_patents = self._integrate(patents, abstracts_dir)
             
             # 結果をファイルに保存
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(integrated_patents, f, indent=2, ensure_ascii=False)
+            _write_json(output_file, integrated_patents)
             
             self.logger.info(f"Abstract integration completed: {output_file}")
-            self.logger.info(f"Loaded {len(abstracts)} abstract files from {abstracts_dir}")
-            return True
+            
+            # 統計情報はメモリ上のデータから算出（出力ファイルの再読み込みを避ける）
+            matched_count = sum(1 for item in integrated_patents if item["abstract"] is not None)
+            return len(integrated_patents), matched_count
                 
         except Exception as e:
             self.logger.error(f"Abstract integration error: {e}")
-            return False
+            return None
     
     def process(self, csv_file: str, abstracts_dir: str, 
                output_file: str) -> Dict:
         """
         メイン処理：CSV変換とアブストラクト統合を実行
         
+        中間データはメモリ上で受け渡し、出力ファイルへの書き込みは最後の1回のみ行います。
+        
         Args:
             csv_file: 入力CSVファイルパス
-            abstracts_dir: アブストラクト個別ファイルディレクトリパス
+            abstracts_dir: アブストラクトのキャッシュDB（および旧形式の個別ファイル）のディレクトリパス
             output_file: 最終出力JSONファイルパス
             
         Returns:
@@ -182,9 +248,6 @@ class AbstractIntegrator:
         """
         start_time = datetime.now()
         
-        # 一時ファイルパス
-        temp_json_file = output_file.replace('.json', '_temp.json')
-        
         result = {
             "status": "failed",
             "start_time": start_time.isoformat(),
@@ -199,36 +262,29 @@ class AbstractIntegrator:
         }
         
         try:
-            # ステップ1: CSVからJSONに変換
+            # ステップ1: CSVを読み込み
             self.logger.info(f"Starting CSV to JSON conversion: {csv_file}")
-            if not self.csv_to_json(csv_file, temp_json_file):
+            try:
+                records = self._csv_to_records(csv_file)
+            except Exception as e:
+                self.logger.error(f"CSV to JSON conversion error: {e}")
                 result["errors"].append("CSV to JSON conversion failed")
                 return result
             
             # ステップ2: アブストラクト統合
             self.logger.info(f"Starting abstract integration: {abstracts_dir}")
-            if not self.integrate_abstracts(temp_json_file, abstracts_dir, output_file):
-                result["errors"].append("Abstract integration failed")
-                return result
-            
-            # 統計情報の取得
             try:
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    integrated_data = json.load(f)
-                
-                result["processed_count"] = len(integrated_data)
-                result["matched_count"] = sum(1 for item in integrated_data 
-                                            if item.get("abstract") is not None)
-                result["unmatched_count"] = result["processed_count"] - result["matched_count"]
-                
+                integrated_patents = self._integrate(records, abstracts_dir)
+                _write_json(output_file, integrated_patents)
             except Exception as e:
-                self.logger.warning(f"Could not calculate statistics: {e}")
+                self.logger.error(f"Abstract integration error: {e}")
+                result["errors"].append("Abstract integration failed")
+                return result
             
-            # 一時ファイルの削除
-            try:
-                Path(temp_json_file).unlink()
-            except FileNotFoundError:
-                pass
+            # 統計情報の記録
+            result["processed_count"] = len(integrated_patents)
+            result["matched_count"] = sum(1 for item in integrated_patents if item["abstract"] is not None)
+            result["unmatched_count"] = result["processed_count"] - result["matched_count"]
             
             # 成功時の結果更新
             end_time = datetime.now()
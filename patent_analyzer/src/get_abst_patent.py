@@ -9,51 +9,157 @@ import sys
 import argparse
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+
+# selectolax (C-based parser) is much faster than BeautifulSoup's html.parser;
+# fall back to BeautifulSoup when it is not installed.
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+    from bs4 import BeautifulSoup
+
+# Compiled once at import instead of on every extract_patent_id call
+_PATENT_ID_RE = re.compile(r'/patent/([^/]+)')
+
+# Seconds to wait for connect/read before giving up on a URL
+REQUEST_TIMEOUT = 10
+
+# Stop reading a page after this many bytes (full patent pages with claims and
+# descriptions can be several MB; the title and abstract come first)
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Successful scrape results keyed by URL (duplicate URLs are fetched only once)
+_RESULT_CACHE = {}
+
+
+def create_session(max_retries=0):
+    """
+    Create a requests.Session with browser headers and a connection pool.
+    
+    max_retries retries failed connections (with backoff) inside the adapter.
+    Read errors are not retried so timeouts still surface as requests.Timeout.
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept-Encoding': 'gzip, deflate'
+    })
+    retries = Retry(total=max_retries, read=False, backoff_factor=0.5)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared session: keep-alive and connection pooling across URLs (and threads)
+_SESSION = create_session()
 
 
 def extract_patent_id(url):
     """Extract patent ID from Google Patents URL."""
-    match = re.search(r'/patent/([^/]+)', url)
+    match = _PATENT_ID_RE.search(url)
     if match:
         return match.group(1)
     return None
 
 
+def parse_patent_html(content):
+    """Extract (title, abstract) from a Google Patents HTML page."""
+    if HTMLParser is not None:
+        tree = HTMLParser(content)
+        
+        title_element = tree.css_first('span[itemprop="title"]') or tree.css_first('h1')
+        title = title_element.text(strip=True) if title_element else "Title not found"
+        
+        abstract_element = (tree.css_first('div[itemprop="abstract"]')
+                            or tree.css_first('section[itemprop="abstract"]')
+                            or tree.css_first('div.abstract'))
+        abstract = abstract_element.text(strip=True) if abstract_element else "Abstract not found"
+        return title, abstract
+    
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    title_element = soup.find('span', {'itemprop': 'title'})
+    if not title_element:
+        title_element = soup.find('h1')
+    title = title_element.get_text(strip=True) if title_element else "Title not found"
+    
+    abstract_element = soup.find('div', {'itemprop': 'abstract'})
+    if not abstract_element:
+        abstract_element = soup.find('section', {'itemprop': 'abstract'})
+    if not abstract_element:
+        abstract_element = soup.find('div', class_='abstract')
+    
+    abstract = abstract_element.get_text(strip=True) if abstract_element else "Abstract not found"
+    return title, abstract
+
+
+def _is_read_timeout(error):
+    """True if a requests.ConnectionError wraps a urllib3 read timeout."""
+    return any(isinstance(cause, ReadTimeoutError)
+               for cause in (*error.args, error.__cause__, error.__context__))
+
+
+def fetch_page_prefix(url, max_bytes=None, timeout=REQUEST_TIMEOUT, session=None):
+    """
+    Download at most max_bytes of a page; title and abstract sit near the top.
+    
+    requests reports a read timeout while streaming the body as ConnectionError;
+    it is re-raised as requests.ReadTimeout (a requests.Timeout) like one on the headers.
+    """
+    if max_bytes is None:
+        max_bytes = MAX_PAGE_BYTES
+    if session is None:
+        session = _SESSION
+    chunks = []
+    size = 0
+    with session.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        try:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes:
+                    break
+        except requests.ConnectionError as e:
+            if _is_read_timeout(e):
+                raise requests.ReadTimeout(e, request=e.request, response=response) from e
+            raise
+    return b''.join(chunks)
+
+
+def fetch_one(url, timeout=REQUEST_TIMEOUT, session=None):
+    """
+    Fetch one patent page and return its ID, title and abstract.
+    
+    Unlike scrape_patent_info, network errors are raised (requests.RequestException)
+    so in-process callers can tell timeouts from other failures.
+    """
+    title, abstract = parse_patent_html(fetch_page_prefix(url, timeout=timeout, session=session))
+    return {
+        "ID": extract_patent_id(url),
+        "Title": title,
+        "Abstract": abstract
+    }
+
+
 def scrape_patent_info(url):
     """Scrape patent title and abstract from Google Patents URL."""
+    # Successful results are memoized per URL; errors are not, so they can be retried
+    cached = _RESULT_CACHE.get(url)
+    if cached is not None:
+        return dict(cached)
+    
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        title_element = soup.find('span', {'itemprop': 'title'})
-        if not title_element:
-            title_element = soup.find('h1')
-        title = title_element.get_text(strip=True) if title_element else "Title not found"
-        
-        abstract_element = soup.find('div', {'itemprop': 'abstract'})
-        if not abstract_element:
-            abstract_element = soup.find('section', {'itemprop': 'abstract'})
-        if not abstract_element:
-            abstract_element = soup.find('div', class_='abstract')
-        
-        abstract = abstract_element.get_text(strip=True) if abstract_element else "Abstract not found"
-        
-        patent_id = extract_patent_id(url)
-        
-        return {
-            "ID": patent_id,
-            "Title": title,
-            "Abstract": abstract
-        }
+        result = fetch_one(url)
+        _RESULT_CACHE[url] = result
+        return dict(result)
         
     except requests.RequestException as e:
         return {
@@ -72,6 +178,8 @@ def scrape_patent_info(url):
 def main():
     parser = argparse.ArgumentParser(description='Extract title and abstract from Google Patents URLs')
     parser.add_argument('-i', '--input', help='Patent URL to scrape')
+    parser.add_argument('-c', '--concurrency', type=int, default=8,
+                        help='Number of URLs to fetch concurrently (default: 8)')
     
     args = parser.parse_args()
     
@@ -90,19 +198,29 @@ def main():
         parser.print_help()
         sys.exit(1)
     
-    results = []
+    valid_urls = []
     for url in urls:
         if not url.startswith('http'):
             print(f"Error: Invalid URL format: {url}", file=sys.stderr)
             continue
-            
-        result = scrape_patent_info(url)
-        # 成功/失敗の判定と表示
-        if result.get("Abstract") and not result["Abstract"].startswith("Error") and result.get("Title") and not result["Title"].startswith("Error"):
-            print(f"[SUCCESS] {result.get('ID') or url}", file=sys.stderr)
-        else:
-            print(f"[FAIL] {result.get('ID') or url} - {result.get('Title')} / {result.get('Abstract')}", file=sys.stderr)
-        results.append(result)
+        valid_urls.append(url)
+    
+    # Duplicate URLs in the input are fetched only once
+    unique_urls = list(dict.fromkeys(valid_urls))
+    
+    # Fetching is network-bound, so overlap requests in threads (results keep input order)
+    results_by_url = {}
+    max_workers = max(1, min(args.concurrency, len(unique_urls)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for url, result in zip(unique_urls, executor.map(scrape_patent_info, unique_urls)):
+            # 成功/失敗の判定と表示
+            if result.get("Abstract") and not result["Abstract"].startswith("Error") and result.get("Title") and not result["Title"].startswith("Error"):
+                print(f"[SUCCESS] {result.get('ID') or url}", file=sys.stderr)
+            else:
+                print(f"[FAIL] {result.get('ID') or url} - {result.get('Title')} / {result.get('Abstract')}", file=sys.stderr)
+            results_by_url[url] = result
+    
+    results = [results_by_url[url] for url in valid_urls]
     
     if len(results) == 1:
         print(json.dumps(results[0], ensure_ascii=False, indent=2))
@@ -4,10 +4,13 @@
 NoX_dataset.jsonを読み込み、patent_orchestrator.pyを適切な引数で実行するパーサスクリプト
 """
 import json
-import sys
+import os
 import subprocess
+import sys
 from pathlib import Path
 
+from patent_orchestrator import build_arg_parser, main as orchestrator_main
+
 REQUIRED_KEYS = [
     "search_result_file",
     "scoring_keywords_file",
@@ -15,13 +18,39 @@ REQUIRED_KEYS = [
 ]
 
 
+def run_orchestrator(orchestrator_args, use_subprocess=False):
+    """
+    patent_orchestratorを実行し、終了コードを返す
+    
+    Args:
+        orchestrator_args: patent_orchestrator.pyのコマンドライン引数
+        use_subprocess: Trueの場合は従来どおり別プロセスでpatent_orchestrator.pyを起動
+        
+    Returns:
+        int: 終了コード
+    """
+    if use_subprocess:
+        orchestrator_path = Path(__file__).parent / "patent_orchestrator.py"
+        return subprocess.run([sys.executable, str(orchestrator_path)] + orchestrator_args, check=False).returncode
+    
+    # 別プロセスを起動せず、同じインタープリタ内でオーケストレーターを呼び出す
+    try:
+        orchestrator_main(build_arg_parser().parse_args(orchestrator_args))
+        return 0
+    except SystemExit as e:
+        # オーケストレーターは終了コードをsys.exitで返す
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+
+
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python parse_and_run_dataset.py <NoX_dataset.json> [--skip-abstract-fetch]")
+        print("Usage: python parse_and_run_dataset.py <NoX_dataset.json> [--skip-abstract-fetch] [--subprocess]")
         sys.exit(1)
     
     # アブストラクトスキップオプションの確認
     skip_abstract_fetch = "--skip-abstract-fetch" in sys.argv
+    # 別プロセスでの実行オプションの確認
+    use_subprocess = "--subprocess" in sys.argv
 
     dataset_path = Path(sys.argv[1])
     if not dataset_path.exists():
@@ -37,22 +66,17 @@ def main():
             print(f"Error: Required key '{key}' not found in {dataset_path.name}")
             sys.exit(1)
 
-    # パス解決
-    base_dir = dataset_path.parent
-    input_csv = str((base_dir / dataset["search_result_file"]).resolve())
-    scoring_keywords = str((base_dir / dataset["scoring_keywords_file"]).resolve())
-    output_dir = str((base_dir / dataset["output_dir"]).resolve())
+    # パス解決（基準ディレクトリのみresolveし、各パスは文字列操作で正規化）
+    base_dir = dataset_path.parent.resolve()
+    input_csv = os.path.normpath(base_dir / dataset["search_result_file"])
+    scoring_keywords = os.path.normpath(base_dir / dataset["scoring_keywords_file"])
+    output_dir = os.path.normpath(base_dir / dataset["output_dir"])
 
     # 出力ディレクトリがなければ作成
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    # patent_orchestrator.pyのパス
-    orchestrator_path = Path(__file__).parent / "patent_orchestrator.py"
-
-    # コマンド組み立て
-    cmd = [
-        sys.executable,
-        str(orchestrator_path),
+    # 引数組み立て
+    orchestrator_args = [
         "--input", input_csv,
         "--output", output_dir,
         "--scoring-keywords", scoring_keywords
@@ -60,21 +84,22 @@ def main():
     
     # アブストラクトスキップオプションを追加
     if skip_abstract_fetch:
-        cmd.append("--skip_abstract_fetch")
+        orchestrator_args.append("--skip_abstract_fetch")
 
-    print("[INFO] Running command:")
-    print(" ".join(cmd))
+    print("[INFO] Running patent_orchestrator with arguments:")
+    print(" ".join(orchestrator_args))
 
     # 実行
     try:
-        result = subprocess.run(cmd, check=False)
-        if result.returncode == 0:
-            print("[INFO] Workflow completed successfully.")
-        else:
-            print(f"[ERROR] Workflow failed with exit code {result.returncode}.")
+        returncode = run_orchestrator(orchestrator_args, use_subprocess=use_subprocess)
     except Exception as e:
         print(f"[ERROR] Failed to run orchestrator: {e}")
         sys.exit(1)
 
+    if returncode == 0:
+        print("[INFO] Workflow completed successfully.")
+    else:
+        print(f"[ERROR] Workflow failed with exit code {returncode}.")
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
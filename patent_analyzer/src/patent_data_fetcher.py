@@ -6,35 +6,145 @@ PatentDataFetcher: JSONファイルから特許データを抽出し、Google Pa
 
 import json
 import logging
+import os
+import re
+import threading
 import time
-import subprocess
 import sys
-from typing import List, Dict, Optional
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Dict, Optional
 from pathlib import Path
 
+import requests
+
+from abstract_cache import open_cache_db, loads as _loads, dumps as _dumps
+from get_abst_patent import create_session, fetch_one
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# キャッシュDBへの一括問い合わせ1回あたりのID数（SQLiteのバインド変数数の上限内）
+CACHE_QUERY_CHUNK = 500
+
+# Google PatentsのURL判定（スキーム http/https、ホスト patents.google.com、パスに /patent/ を含む）
+_GP_URL_RE = re.compile(r'[\x00-\x20]*(?i:https?)://patents\.google\.com/(?:[^?#]*/)?patent/')
+
+
+def _read_json(path) -> Any:
+    """JSONファイルを読み込み"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+def _iter_json_array(path) -> Iterator[Any]:
+    """JSON配列の要素を1件ずつ返す（ijsonが利用可能ならファイル全体をメモリに載せない）"""
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    else:
+        yield from _read_json(path)
+
+def _write_json(path, data: Any):
+    """JSONファイルにインデント付きで書き込み（orjsonが利用可能ならorjsonを使用）"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Retry-Afterヘッダー（秒数指定）を取得"""
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+# tqdmがない場合に進捗を表示する間隔（特許数）
+PROGRESS_INTERVAL = 50
+
+# 429/5xx応答時のバックオフ（秒）の上限
+MAX_BACKOFF = 60.0
+
+
+class RateLimiter:
+    """全ワーカースレッドで共有するリクエスト間隔の制御（実際のHTTPリクエストのみを間引く）"""
+    
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: リクエスト開始間隔の最小値（秒）
+        """
+        self.interval = max(0.0, interval)
+        self._next = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """次のリクエスト枠を予約し、その時刻まで待機"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+    
+    def backoff(self, seconds: float):
+        """サーバーから抑制された場合、以降のリクエスト開始を指定秒数遅らせる"""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
 
 class PatentDataFetcher:
     """JSONファイルから特許データを抽出し、Google Patentsからアブストラクトを取得する"""
     
-    def __init__(self, json_file_path: str, delay: float = 2.0, max_retries: int = 3, timeout: int = 30, abstracts_dir: str = "data/abstracts"):
+    def __init__(self, json_file_path: str, delay: float = 2.0, max_retries: int = 3, timeout: int = 30, abstracts_dir: str = "data/abstracts", concurrency: int = 4):
         """
         JSONファイルパスを初期化
         
         Args:
             json_file_path: 特許データJSONファイルパス
-            delay: リクエスト間の遅延時間（秒）
-            max_retries: 最大リトライ回数
+            delay: リクエスト開始の最小間隔（秒）。全ワーカー合計でdelay秒に1回まで（並行取得でも頻度は逐次取得と同じ）
+            max_retries: 接続失敗時・429/5xx応答時の最大リトライ回数
             timeout: タイムアウト時間（秒）
-            abstracts_dir: アブストラクト個別ファイルの保存ディレクトリ
+            abstracts_dir: アブストラクトのキャッシュDB（abstracts.sqlite3）を置くディレクトリ
+            concurrency: 同時に取得する特許数
         """
         self.json_file_path = json_file_path
         self.delay = delay
         self.max_retries = max_retries
         self.timeout = timeout
+        self.concurrency = max(1, concurrency)
+        # 全ワーカー合計のリクエスト開始間隔をdelay秒以上に保つ（逐次取得と同じ頻度の上限）
+        # 並行取得で短縮されるのは応答待ちの時間のみ
+        self._limiter = RateLimiter(self.delay)
         self.abstracts_dir = Path(abstracts_dir)
         self.abstracts_dir.mkdir(parents=True, exist_ok=True)
+        # DB導入前の個別ファイルパスの共通部分（特許ごとのパス生成は文字列連結のみ）
+        self._abstract_path_prefix = os.path.join(str(self.abstracts_dir), "")
+        # DB導入前の個別ファイル（移行用）のIDを一度のディレクトリ走査で把握（特許ごとのstatを避ける）
+        with os.scandir(self.abstracts_dir) as it:
+            self._cached_ids = {e.name[:-5] for e in it if e.name.endswith('.json') and e.is_file()}
         self.logger = logging.getLogger(__name__)
+        # extract_patent_data実行中のキャッシュDB書き込み用スレッド
+        self._writer = None
+        # 取得済みアブストラクトの唯一の保存先（特許IDをキーとする単一のSQLite DB）
+        self._db_lock = threading.Lock()
+        self._db = open_cache_db(self.abstracts_dir, check_same_thread=False)
+        # Google Patentsへの接続を全リクエスト（全スレッド）で再利用
+        self._session = create_session(max_retries=self.max_retries)
         
     def extract_patent_data(self, start_number: int = 1, batch_size: int = None) -> List[Dict[str, str]]:
         """
@@ -46,157 +156,202 @@ class PatentDataFetcher:
             List[Dict]: 拡張特許データリスト
         """
         try:
-            # JSONファイル読み込み
-            with open(self.json_file_path, 'r', encoding='utf-8') as f:
-                patent_data = json.load(f)
-            self.logger.info(f"Loaded {len(patent_data)} patents from {self.json_file_path}")
-            # 特許データの抽出とバリデーション
-            valid_patents = []
+            start_idx = max(0, start_number - 1)
+            end_limit = start_idx + batch_size if batch_size is not None else None
+            # JSONを1件ずつ読み込みながらバリデーションし、バッチ範囲の特許のみ保持
+            # （_validate_patent_record と同じ判定をメソッド呼び出しなしで一括実行）
+            batch_patents = []
+            total = 0
+            loaded_count = 0
             invalid_count = 0
-            for patent in patent_data:
-                if self._validate_patent_record(patent):
-                    valid_patents.append(patent)
+            match_url = _GP_URL_RE.match
+            for patent in _iter_json_array(self.json_file_path):
+                loaded_count += 1
+                url = patent.get("result_link")
+                if patent.get("id") and url and isinstance(url, str) and match_url(url):
+                    if total >= start_idx and (end_limit is None or total < end_limit):
+                        batch_patents.append(patent)
+                    total += 1
                 else:
                     invalid_count += 1
-                    self.logger.warning(f"Invalid patent record: {patent.get('id', 'Unknown')}")
+                    self.logger.warning("Invalid patent record: %s", patent.get('id', 'Unknown'))
+            self.logger.info("Loaded %s patents from %s", loaded_count, self.json_file_path)
             if invalid_count > 0:
-                self.logger.warning(f"Skipped {invalid_count} invalid patent records")
+                self.logger.warning("Skipped %s invalid patent records", invalid_count)
             # バッチ範囲の決定
-            total = len(valid_patents)
-            start_idx = max(0, start_number - 1)
-            if batch_size is not None:
-                end_idx = min(start_idx + batch_size, total)
+            if end_limit is not None:
+                end_idx = min(end_limit, total)
             else:
                 end_idx = total
-            batch_patents = valid_patents[start_idx:end_idx]
-            enhanced_patents = []
             skipped_count = 0
             processed_count = 0
             print(f"\n--- Processing patents {start_idx+1} to {end_idx} of {total} ---", file=sys.stdout)
-            for i, patent in enumerate(batch_patents, start=start_idx+1):
-                patent_id = patent.get("id")
-                patent_url = patent.get("result_link")
-                print(f"Now processing: {patent_id} {patent_url}", file=sys.stdout)
-                enhanced_patent = self._fetch_abstract_for_patent(patent)
-                enhanced_patents.append(enhanced_patent)
+            # キャッシュ済みの特許は一括で読み込んでその場で反映し、未取得の特許のみネットワーク処理へ回す
+            existing_abstracts = self._load_existing_abstracts([p.get("id") for p in batch_patents])
+            to_fetch = []
+            for patent in batch_patents:
+                existing_abstract = existing_abstracts.get(patent.get("id"))
+                if self._has_abstract(existing_abstract):
+                    self._apply_cached_abstract(patent, existing_abstract)
+                else:
+                    to_fetch.append(patent)
+            # ネットワーク待ちが支配的なため、複数の特許を並行して取得
+            # キャッシュDBへの書き込みは専用スレッドで行い、取得処理をディスクI/Oで止めない
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                self._writer = writer
+                try:
+                    with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                        results = executor.map(self._fetch_and_save_abstract, to_fetch)
+                        # 特許データはその場で拡張されるため、結果の消費は進捗表示のためだけ
+                        for _ in self._with_progress(results, len(to_fetch)):
+                            pass
+                finally:
+                    self._writer = None
+            enhanced_patents = batch_patents
+            for enhanced_patent in enhanced_patents:
                 # スキップされたかどうかをチェック
                 if enhanced_patent.get("abstract_source") == "cached_file":
                     skipped_count += 1
                 elif enhanced_patent.get("abstract_source") in ["newly_fetched", "error_saved", "timeout_saved", "exception_saved"]:
                     processed_count += 1
-                # リクエスト間の遅延（スキップされた場合は短縮）
-                if i < end_idx:
-                    if enhanced_patent.get("abstract_source") == "cached_file":
-                        time.sleep(0.5)
-                    else:
-                        time.sleep(self.delay)
-            print(f"\n--- Summary ---", file=sys.stdout)
-            print(f"Processed: {processed_count} patents", file=sys.stdout)
-            print(f"Skipped: {skipped_count} patents (already had abstracts)", file=sys.stdout)
-            print(f"Total: {len(enhanced_patents)} patents", file=sys.stdout)
-            self.logger.info(f"Successfully processed {processed_count} patents, skipped {skipped_count} patents with existing abstracts (batch)")
+            print(f"\n--- Summary ---\n"
+                  f"Processed: {processed_count} patents\n"
+                  f"Skipped: {skipped_count} patents (already had abstracts)\n"
+                  f"Total: {len(enhanced_patents)} patents", file=sys.stdout)
+            self.logger.info("Successfully processed %s patents, skipped %s patents with existing abstracts (batch)", processed_count, skipped_count)
             return enhanced_patents
         except FileNotFoundError:
-            self.logger.error(f"JSON file not found: {self.json_file_path}")
+            self.logger.error("JSON file not found: %s", self.json_file_path)
             raise
         except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON format: {e}")
+            self.logger.error("Invalid JSON format: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error during data extraction: {e}")
+            self.logger.error("Unexpected error during data extraction: %s", e)
             raise
     
-    def _fetch_abstract_for_patent(self, patent: Dict) -> Dict:
+    def _with_progress(self, results: Iterator[Dict], total: int) -> Iterator[Dict]:
         """
-        単一の特許に対してアブストラクトを取得（個別ファイル管理）
+        取得結果を順に返しながら進捗を表示（tqdmがあればプログレスバー、なければ一定件数ごとに1行）
         
         Args:
-            patent: 特許データ辞書
+            results: 拡張特許データのイテレータ（入力順）
+            total: 特許数
             
         Returns:
-            Dict: アブストラクト情報を含む拡張された特許データ
+            Iterator[Dict]: resultsと同じ拡張特許データ
         """
-        patent_id = patent.get("id")
-        patent_url = patent.get("result_link")
+        if tqdm is not None:
+            with tqdm(total=total, desc="abstracts", unit="patent") as pbar:
+                for enhanced_patent in results:
+                    pbar.set_postfix_str(str(enhanced_patent.get("id")), refresh=False)
+                    pbar.update(1)
+                    yield enhanced_patent
+            return
+        for i, enhanced_patent in enumerate(results, 1):
+            if i % PROGRESS_INTERVAL == 0 or i == total:
+                print(f"Progress: {i}/{total} patents", file=sys.stdout)
+            yield enhanced_patent
+    
+    def _fetch_with_retry(self, patent_url: str) -> Dict:
+        """
+        リクエスト間隔を守ってアブストラクトを取得（429/5xx応答時のみバックオフして再試行）
         
-        # 元の特許データをコピー
-        enhanced_patent = patent.copy()
+        Args:
+            patent_url: Google PatentsのURL
+            
+        Returns:
+            Dict: get_abst_patent.fetch_one の結果（RetryCount付き）
+        """
+        attempt = 0
+        while True:
+            self._limiter.acquire()
+            try:
+                abstract_data = fetch_one(patent_url, timeout=self.timeout, session=self._session)
+                abstract_data["RetryCount"] = attempt
+                return abstract_data
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if attempt >= self.max_retries or status is None or (status != 429 and status < 500):
+                    raise
+                wait = _retry_after_seconds(e.response)
+                if wait is None:
+                    wait = max(self.delay, 1.0) * (2 ** attempt)
+                wait = min(wait, MAX_BACKOFF)
+                self.logger.warning("HTTP %s for %s, retrying in %.1fs", status, patent_url, wait)
+                self._limiter.backoff(wait)
+                attempt += 1
+    
+    def _fetch_abstract_for_patent(self, patent: Dict) -> Dict:
+        """
+        単一の特許に対してアブストラクトを取得（キャッシュDB管理）
         
+        Args:
+            patent: 特許データ辞書（アブストラクト情報を直接追加する）
+            
+        Returns:
+            Dict: アブストラクト情報を含む拡張された特許データ（patentと同じオブジェクト）
+        """
+        # 特許データはextract_patent_dataで読み込んだ後に再利用しないため、コピーせずに拡張する
         # 既存のアブストラクトファイルをチェック
-        existing_abstract = self._load_existing_abstract(patent_id)
-        if existing_abstract and existing_abstract.get("Abstract") and existing_abstract.get("Abstract").strip():
-            print(f"Skipping {patent_id} - abstract file already exists", file=sys.stdout)
-            self.logger.info(f"Skipped {patent_id} - abstract file already exists")
+        existing_abstract = self._load_existing_abstract(patent.get("id"))
+        if self._has_abstract(existing_abstract):
+            return self._apply_cached_abstract(patent, existing_abstract)
+        
+        return self._fetch_and_save_abstract(patent)
+    
+    @staticmethod
+    def _has_abstract(existing_abstract: Optional[Dict]) -> bool:
+        """キャッシュ済みデータに有効なアブストラクトが含まれるか"""
+        return bool(existing_abstract and existing_abstract.get("Abstract") and existing_abstract.get("Abstract").strip())
+    
+    def _apply_cached_abstract(self, patent: Dict, existing_abstract: Dict) -> Dict:
+        """キャッシュ済みのアブストラクト情報を特許データに追加"""
+        self.logger.info("Skipped %s - abstract file already exists", patent.get("id"))
+        patent.update({
+            "abstract": existing_abstract.get("Abstract"),
+            "abstract_title": existing_abstract.get("Title"),
+            "abstract_url": existing_abstract.get("URL"),
+            "abstract_error": existing_abstract.get("Error"),
+            "abstract_retry_count": existing_abstract.get("RetryCount", 0),
+            "abstract_source": "cached_file"
+        })
+        return patent
+    
+    def _fetch_and_save_abstract(self, patent: Dict) -> Dict:
+        """
+        Google Patentsからアブストラクトを取得して保存（キャッシュ確認なし、ワーカースレッドで実行）
+        
+        Args:
+            patent: 特許データ辞書（アブストラクト情報を直接追加する）
             
-            # 既存のアブストラクト情報を追加
-            enhanced_patent.update({
-                "abstract": existing_abstract.get("Abstract"),
-                "abstract_title": existing_abstract.get("Title"),
-                "abstract_url": existing_abstract.get("URL"),
-                "abstract_error": existing_abstract.get("Error"),
-                "abstract_retry_count": existing_abstract.get("RetryCount", 0),
-                "abstract_source": "cached_file"
-            })
-            return enhanced_patent
+        Returns:
+            Dict: アブストラクト情報を含む拡張された特許データ（patentと同じオブジェクト）
+        """
+        patent_id = patent.get("id")
+        patent_url = patent.get("result_link")
+        enhanced_patent = patent
         
         try:
-            # get_abst_patent.pyスクリプトを実行してアブストラクトを取得
-            cmd = [
-                sys.executable,
-                "src/get_abst_patent.py",
-                "-i",
-                patent_url
-            ]
+            # get_abst_patentの取得処理をプロセス内で直接呼び出す（サブプロセス起動なし）
+            abstract_data = self._fetch_with_retry(patent_url)
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout
-            )
+            # キャッシュDBに保存
+            self._save_abstract(patent_id, abstract_data)
             
-            if result.returncode == 0:
-                # 成功時：アブストラクトデータを解析
-                abstract_data = json.loads(result.stdout)
-                
-                # 個別ファイルに保存
-                self._save_abstract_to_file(patent_id, abstract_data)
-                
-                # アブストラクト情報を追加
-                enhanced_patent.update({
-                    "abstract": abstract_data.get("Abstract"),
-                    "abstract_title": abstract_data.get("Title"),
-                    "abstract_url": abstract_data.get("URL"),
-                    "abstract_error": None,
-                    "abstract_retry_count": abstract_data.get("RetryCount", 0),
-                    "abstract_source": "newly_fetched"
-                })
-                
-                self.logger.debug(f"Successfully fetched and saved abstract for {patent_id}")
-                
-            else:
-                # 失敗時：エラー情報を記録
-                error_data = {
-                    "Abstract": None,
-                    "Title": None,
-                    "URL": patent_url,
-                    "Error": result.stderr.strip(),
-                    "RetryCount": 0
-                }
-                self._save_abstract_to_file(patent_id, error_data)
-                
-                enhanced_patent.update({
-                    "abstract": None,
-                    "abstract_title": None,
-                    "abstract_url": None,
-                    "abstract_error": result.stderr.strip(),
-                    "abstract_retry_count": 0,
-                    "abstract_source": "error_saved"
-                })
-                
-                self.logger.warning(f"Failed to fetch abstract for {patent_id}: {result.stderr}")
+            # アブストラクト情報を追加
+            enhanced_patent.update({
+                "abstract": abstract_data.get("Abstract"),
+                "abstract_title": abstract_data.get("Title"),
+                "abstract_url": abstract_data.get("URL"),
+                "abstract_error": None,
+                "abstract_retry_count": abstract_data.get("RetryCount", 0),
+                "abstract_source": "newly_fetched"
+            })
+            
+            self.logger.debug("Successfully fetched and saved abstract for %s", patent_id)
                 
-        except subprocess.TimeoutExpired:
+        except requests.Timeout:
             error_data = {
                 "Abstract": None,
                 "Title": None,
@@ -204,7 +359,7 @@ class PatentDataFetcher:
                 "Error": "Timeout while fetching abstract",
                 "RetryCount": 0
             }
-            self._save_abstract_to_file(patent_id, error_data)
+            self._save_abstract(patent_id, error_data)
             
             enhanced_patent.update({
                 "abstract": None,
@@ -214,7 +369,29 @@ class PatentDataFetcher:
                 "abstract_retry_count": 0,
                 "abstract_source": "timeout_saved"
             })
-            self.logger.warning(f"Timeout while fetching abstract for {patent_id}")
+            self.logger.warning("Timeout while fetching abstract for %s", patent_id)
+            
+        except requests.RequestException as e:
+            # 失敗時（HTTPエラー・接続エラー）：エラー情報を記録
+            error_data = {
+                "Abstract": None,
+                "Title": None,
+                "URL": patent_url,
+                "Error": str(e),
+                "RetryCount": 0
+            }
+            self._save_abstract(patent_id, error_data)
+            
+            enhanced_patent.update({
+                "abstract": None,
+                "abstract_title": None,
+                "abstract_url": None,
+                "abstract_error": str(e),
+                "abstract_retry_count": 0,
+                "abstract_source": "error_saved"
+            })
+            
+            self.logger.warning("Failed to fetch abstract for %s: %s", patent_id, e)
             
         except Exception as e:
             error_data = {
@@ -224,7 +401,7 @@ class PatentDataFetcher:
                 "Error": str(e),
                 "RetryCount": 0
             }
-            self._save_abstract_to_file(patent_id, error_data)
+            self._save_abstract(patent_id, error_data)
             
             enhanced_patent.update({
                 "abstract": None,
@@ -234,34 +411,108 @@ class PatentDataFetcher:
                 "abstract_retry_count": 0,
                 "abstract_source": "exception_saved"
             })
-            self.logger.error(f"Error fetching abstract for {patent_id}: {e}")
+            self.logger.error("Error fetching abstract for %s: %s", patent_id, e)
         
         return enhanced_patent
     
-    def _get_abstract_file_path(self, patent_id: str) -> Path:
-        """特許IDに対応するアブストラクトファイルパスを取得"""
-        return self.abstracts_dir / f"{patent_id}.json"
+    def _get_abstract_file_path(self, patent_id: str) -> str:
+        """特許IDに対応するアブストラクトファイルパスを取得（Pathオブジェクトを作らず文字列連結）"""
+        return self._abstract_path_prefix + patent_id + ".json"
     
     def _load_existing_abstract(self, patent_id: str) -> Optional[Dict]:
-        """既存のアブストラクトファイルを読み込み"""
-        abstract_file = self._get_abstract_file_path(patent_id)
-        if abstract_file.exists():
+        """既存のアブストラクトをキャッシュDBから読み込み（DB未登録ならDB導入前の個別ファイルをDBへ取り込む）"""
+        try:
+            with self._db_lock:
+                row = self._db.execute("SELECT data FROM abstracts WHERE id=?", (patent_id,)).fetchone()
+            if row is not None:
+                return _loads(row[0])
+        except Exception as e:
+            self.logger.warning("Failed to load existing abstract for %s: %s", patent_id, e)
+            return None
+        
+        # 移行用：DB導入前に保存された個別ファイルがあればDBへ登録する
+        if patent_id in self._cached_ids:
+            abstract_file = self._get_abstract_file_path(patent_id)
             try:
-                with open(abstract_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                abstract_data = _read_json(abstract_file)
+                self._store_abstract(patent_id, abstract_data)
+                return abstract_data
             except Exception as e:
-                self.logger.warning(f"Failed to load existing abstract for {patent_id}: {e}")
+                self.logger.warning("Failed to load existing abstract for %s: %s", patent_id, e)
         return None
     
-    def _save_abstract_to_file(self, patent_id: str, abstract_data: Dict):
-        """アブストラクトデータを個別ファイルに保存"""
-        abstract_file = self._get_abstract_file_path(patent_id)
+    def _load_existing_abstracts(self, patent_ids: List[str]) -> Dict[str, Dict]:
+        """複数の特許の既存アブストラクトをキャッシュDBからまとめて読み込み（IDをキーとする辞書）"""
+        existing = {}
+        unique_ids = list(dict.fromkeys(patent_ids))
         try:
-            with open(abstract_file, 'w', encoding='utf-8') as f:
-                json.dump(abstract_data, f, indent=2, ensure_ascii=False)
-            self.logger.debug(f"Saved abstract to {abstract_file}")
+            for i in range(0, len(unique_ids), CACHE_QUERY_CHUNK):
+                chunk = unique_ids[i:i + CACHE_QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                with self._db_lock:
+                    rows = self._db.execute(f"SELECT id, data FROM abstracts WHERE id IN ({placeholders})", chunk).fetchall()
+                for patent_id, data in rows:
+                    existing[patent_id] = _loads(data)
         except Exception as e:
-            self.logger.error(f"Failed to save abstract for {patent_id}: {e}")
+            self.logger.warning("Failed to load existing abstracts: %s", e)
+        # DB未登録で旧形式の個別ファイルがあるもの（移行前のデータ）
+        for patent_id in unique_ids:
+            if patent_id not in existing and patent_id in self._cached_ids:
+                abstract_data = self._load_existing_abstract(patent_id)
+                if abstract_data is not None:
+                    existing[patent_id] = abstract_data
+        return existing
+    
+    def _store_abstract(self, patent_id: str, abstract_data: Dict):
+        """アブストラクトデータをキャッシュDBに登録"""
+        data = _dumps(abstract_data)
+        with self._db_lock:
+            self._db.execute("INSERT OR REPLACE INTO abstracts(id, data) VALUES (?, ?)", (patent_id, data))
+    
+    def _save_abstract(self, patent_id: str, abstract_data: Dict):
+        """アブストラクトデータをキャッシュDBに保存（extract_patent_data実行中は書き込み用スレッドで実行）"""
+        writer = self._writer
+        if writer is not None:
+            writer.submit(self._store_abstract_logged, patent_id, abstract_data)
+        else:
+            self._store_abstract_logged(patent_id, abstract_data)
+    
+    def _store_abstract_logged(self, patent_id: str, abstract_data: Dict):
+        """キャッシュDBに登録し、失敗時はログに記録（次回実行時に再取得される）"""
+        try:
+            self._store_abstract(patent_id, abstract_data)
+            self.logger.debug("Saved abstract for %s", patent_id)
+        except Exception as e:
+            self.logger.error("Failed to save abstract for %s: %s", patent_id, e)
+    
+    def export_abstracts(self, output_dir: str) -> int:
+        """
+        キャッシュDBの全アブストラクトを個別JSONファイルとして書き出す（DBを使わないツール向け）
+        
+        abstracts_dir内の個別ファイルはDB導入前のファイルとして読み込まれるため、
+        abstracts_dirとは別のディレクトリを指定すること。
+        
+        Args:
+            output_dir: 出力ディレクトリ（abstracts_dir以外）
+            
+        Returns:
+            int: 書き出したファイル数
+        """
+        out_dir = Path(output_dir)
+        if out_dir.resolve() == self.abstracts_dir.resolve():
+            raise ValueError(f"output_dir must differ from abstracts_dir: {output_dir}")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        with self._db_lock:
+            rows = self._db.execute("SELECT id, data FROM abstracts").fetchall()
+        for patent_id, data in rows:
+            _write_json(out_dir / f"{patent_id}.json", _loads(data))
+        return len(rows)
+    
+    def close(self):
+        """キャッシュDBとHTTPセッションを閉じる"""
+        with self._db_lock:
+            self._db.close()
+        self._session.close()
     
     def _validate_patent_record(self, patent: Dict) -> bool:
         """特許レコードのバリデーション"""
@@ -277,23 +528,24 @@ class PatentDataFetcher:
     
     def validate_url(self, url: str) -> bool:
         """URLがGoogle Patentsの有効なURLかチェック"""
-        try:
-            parsed = urlparse(url)
-            return (
-                parsed.scheme in ['http', 'https'] and
-                parsed.netloc == 'patents.google.com' and
-                '/patent/' in parsed.path
-            )
-        except Exception:
-            return False
-
+        return isinstance(url, str) and _GP_URL_RE.match(url) is not None
 
 if __name__ == "__main__":
     # テスト用
     import sys
     
+    if len(sys.argv) == 4 and sys.argv[1] == "--export-abstracts":
+        # キャッシュDBの内容を個別JSONファイルとして別ディレクトリに書き出す
+        fetcher = PatentDataFetcher(None, abstracts_dir=sys.argv[2])
+        try:
+            print(f"Exported {fetcher.export_abstracts(sys.argv[3])} abstracts to {sys.argv[3]}")
+        finally:
+            fetcher.close()
+        sys.exit(0)
+    
     if len(sys.argv) != 2:
         print("Usage: python patent_data_fetcher.py <json_file_path>")
+        print("       python patent_data_fetcher.py --export-abstracts <abstracts_dir> <output_dir>")
         sys.exit(1)
     
     fetcher = PatentDataFetcher(sys.argv[1])
@@ -302,4 +554,5 @@ if __name__ == "__main__":
         print(json.dumps(data, indent=2, ensure_ascii=False))
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1) 
\ No newline at end of file
+    finally:
+        fetcher.close()
@@ -3,24 +3,121 @@
 """
 Patent Orchestrator - 特許分析システム全体を統合し、ワークフローを管理するメインコンポーネント
 
-jqベースのAbstract Integratorを含む各コンポーネントの実行順序とデータ連携を管理します。
+Abstract Integratorを含む各コンポーネントの実行順序とデータ連携を管理します。
 """
 
+import csv
+import heapq
 import json
 import logging
+import os
 import sys
 import argparse
-import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import math
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 # ローカルモジュールのインポート
 from patent_data_fetcher import PatentDataFetcher
 from abstract_integrator import AbstractIntegrator
 from relevance_scorer import RelevanceScorer
 
+# テストモードで使用するモックアブストラクト取得スクリプトのディレクトリ
+MOCK_FETCHER_DIR = Path(__file__).resolve().parent.parent / "test"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# 出力JSONのフィールド名とGoogle Patents CSVのカラム名の対応
+CSV_COLUMN_MAP = [
+    ("id", "id"),
+    ("title", "title"),
+    ("assignee", "assignee"),
+    ("inventors", "inventor/author"),
+    ("priority_date", "priority date"),
+    ("filing_date", "filing/creation date"),
+    ("publication_date", "publication date"),
+    ("grant_date", "grant date"),
+    ("result_link", "result link")
+]
+
+# 特許レコードのJSON変換（インデントなしのためCエンコーダが使われる。NaNスコアもそのまま出力）
+_encode_record = json.JSONEncoder(ensure_ascii=False).encode
+
+def _encode_record_lines(records: Iterable[Dict]) -> Iterator[str]:
+    """特許レコードをJSON配列の1行分ずつ（区切りの改行・カンマ付き）エンコード"""
+    separator = '\n'
+    for record in records:
+        yield separator + _encode_record(record)
+        separator = ',\n'
+
+def _write_json_records(path, records: Iterable[Dict]):
+    """特許レコードのリストを1件1行のJSON配列として順次書き出し（全体の文字列を作らない）"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        f.writelines(_encode_record_lines(records))
+        f.write('\n]')
+
+def _iter_json_records(path) -> Iterator[Dict]:
+    """_write_json_records形式（1件1行）のJSON配列を1行ずつ読み込み（それ以外の形式はjson.loadで一括読み込み）"""
+    # ijsonはNaNスコアを含むファイルを読めないため、自前の1件1行形式のみ行単位で処理する
+    with open(path, 'r', encoding='utf-8') as f:
+        first_line = f.readline().rstrip()
+        second_line = f.readline().rstrip()
+        if first_line != '[' or not (second_line.startswith('{') or second_line == ']'):
+            f.seek(0)
+            yield from json.load(f)
+            return
+        line = second_line
+        while line and line != ']':
+            yield json.loads(line.rstrip(','))
+            line = f.readline().rstrip()
+
+def _score_key(patent: Dict) -> Any:
+    """ソート用のスコア取得（スコアなしは0）"""
+    return patent.get("relevance_score", 0)
+
+def _drop_nan_scores(scored_data: Iterable[Dict]) -> List[Dict]:
+    """NaNスコアの特許を除外したリストを返す（元の順序）"""
+    # NaNだけが自身と等しくならない（isinstance + math.isnan の呼び出しを省略。スコアなしは残す）
+    return [p for p in scored_data if (score := p.get("relevance_score")) == score]
+
+def _sort_by_score(scored_data: List[Dict]) -> List[Dict]:
+    """NaNスコアの特許を除外し、スコアの降順（同点は元の順序）に並べたリストを返す"""
+    valid_scored = _drop_nan_scores(scored_data)
+    valid_scored.sort(key=_score_key, reverse=True)
+    return valid_scored
+
+def _count_relevance(valid_scored: List[Dict], presorted: bool = True) -> Dict[str, int]:
+    """NaNを除外した特許を関連度（高: 30以上、中: 10以上30未満、低: 10未満）ごとに集計"""
+    high = medium = 0
+    for p in valid_scored:
+        score = p.get("relevance_score", 0)
+        if score >= 30:
+            high += 1
+        elif score >= 10:
+            medium += 1
+        elif presorted:
+            # スコア降順に並んでいれば、10未満に達した時点で残りはすべて低関連度
+            break
+    return {"high": high, "medium": medium, "low": len(valid_scored) - high - medium}
+
+def _write_json_document(path, data: Any, indent: bool = True):
+    """小さな辞書をJSONで保存（orjsonが利用可能ならorjsonを使用。indent=Falseで整形なし）"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
 class PatentOrchestrator:
     """特許分析システム全体のオーケストレーター"""
     
@@ -53,6 +150,20 @@ class PatentOrchestrator:
             "warnings": []
         }
         
+        # Relevance Scorerの結果（最終結果の生成で再利用）
+        self._sorted_scored = None
+        self._relevance_counts = None
+        
+        # 存在を確認済み（またはこのワークフローで作成した）入力ファイル
+        self._verified_files = set()
+        
+        # 出力先ディレクトリと出力ファイル名のタイムスタンプ（1回のワークフローで共通）
+        self._output_base = Path(self.config["output"]["base_dir"])
+        self._timestamp = datetime.now().strftime(self.config["output"]["timestamp_format"])
+        
+        # 各コンポーネントの失敗時に処理を続行するか（コンポーネントごとの設定参照を省略）
+        self._continue_on_error = self.config["error_handling"]["continue_on_error"]
+        
         # 出力ディレクトリの作成
         self._create_output_directories()
     
@@ -65,7 +176,8 @@ class PatentOrchestrator:
             },
             "output": {
                 "base_dir": "data/processed",
-                "timestamp_format": "%Y%m%d_%H%M%S"
+                "timestamp_format": "%Y%m%d_%H%M%S",
+                "indent_results": True
             },
             "components": {
                 "csv_to_json_converter": {
@@ -77,7 +189,8 @@ class PatentOrchestrator:
                     "enabled": True,
                     "delay": 2,
                     "max_retries": 3,
-                    "timeout": 30
+                    "timeout": 30,
+                    "concurrency": 4
                 },
                 "abstract_integrator": {
                     "enabled": True,
@@ -147,21 +260,31 @@ class PatentOrchestrator:
     
     def _create_output_directories(self):
         """出力ディレクトリの作成"""
-        output_dir = Path(self.config["output"]["base_dir"])
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_base.mkdir(parents=True, exist_ok=True)
         
         # ログディレクトリ
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
     
+    def _require_file(self, path: str, description: str):
+        """入力ファイルの存在確認（同じワークフロー内で確認済みのパスは再確認しない）"""
+        if path in self._verified_files:
+            return
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{description} not found: {path}")
+        self._verified_files.add(path)
+    
     def _get_timestamped_filename(self, base_name: str, extension: str = "json") -> str:
         """タイムスタンプ付きファイル名の生成"""
-        timestamp = datetime.now().strftime(self.config["output"]["timestamp_format"])
-        return f"{base_name}_{timestamp}.{extension}"
+        return f"{base_name}_{self._timestamp}.{extension}"
+    
+    def _get_output_path(self, base_name: str, extension: str = "json") -> Path:
+        """出力ディレクトリ内のタイムスタンプ付きファイルパスの生成"""
+        return self._output_base / self._get_timestamped_filename(base_name, extension)
     
     def _convert_csv_to_json(self, csv_file: str, output_file: str) -> bool:
         """
-        CSVファイルをPythonのcsvモジュールを使用してJSONに変換
+        CSVファイルをJSONに変換（pandasが利用可能ならpandas、なければcsvモジュールを使用）
         
         Args:
             csv_file: 入力CSVファイルパス
@@ -171,41 +294,49 @@ class PatentOrchestrator:
             bool: 成功時True、失敗時False
         """
         try:
-            import csv
-            
             self.logger.info(f"Converting CSV to JSON: {csv_file}")
             
-            # CSVファイルを読み込み
-            patents = []
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                # 先頭行がカラム名でない場合を自動スキップ
-                first_line = f.readline()
-                if not first_line.lower().startswith('id,'):
-                    # 2行目以降にカラム名がある場合
-                    header_line = f.readline()
+            # CSVファイルを読み込み（utf-8-sigで先頭のBOMを除去。pandas・csvモジュールの両方に適用される）
+            with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+                # 先頭行がカラム名でない場合（"search URL:"行など）を自動スキップ
+                reader = csv.reader(f)
+                first_row = next(reader, [])
+                if first_row and first_row[0].strip().lower() == 'id':
+                    header_row = first_row
+                    skip_rows = 0
                 else:
-                    header_line = first_line
-                # DictReaderをカラム名行から開始
-                reader = csv.DictReader(f, fieldnames=[h.strip() for h in header_line.strip().split(',')])
-                for row in reader:
+                    # 2行目にカラム名がある場合
+                    header_row = next(reader, [])
+                    skip_rows = 1
+                
+                if pd is not None:
+                    # pandasのCパーサーで一括読み込み（全列を文字列として扱い、空欄は空文字列）
+                    f.seek(0)
+                    df = pd.read_csv(f, skiprows=skip_rows, dtype=str, na_filter=False)
+                    df = df.rename(columns=str.strip)
+                    df = df[[column for _, column in CSV_COLUMN_MAP]]
+                    df.columns = [field for field, _ in CSV_COLUMN_MAP]
                     # 空行やidが空の行はスキップ
-                    if not row.get("id") or row["id"] == "id":
-                        continue
-                    patents.append({
-                        "id": row["id"],
-                        "title": row["title"],
-                        "assignee": row["assignee"],
-                        "inventors": row["inventor/author"],
-                        "priority_date": row["priority date"],
-                        "filing_date": row["filing/creation date"],
-                        "publication_date": row["publication date"],
-                        "grant_date": row["grant date"],
-                        "result_link": row["result link"]
-                    })
+                    df = df[(df["id"] != "") & (df["id"] != "id")]
+                    patents = df.to_dict("records")
+                else:
+                    # カラム名行から各フィールドの列位置を求め、以降の行は位置で参照
+                    header = [h.strip() for h in header_row]
+                    indexes = [header.index(column) for _, column in CSV_COLUMN_MAP]
+                    fields = [field for field, _ in CSV_COLUMN_MAP]
+                    width = len(header)
+                    patents = []
+                    id_index = indexes[0]
+                    for row in reader:
+                        if len(row) < width:
+                            row.extend([None] * (width - len(row)))
+                        # 空行やidが空の行はスキップ
+                        if not row[id_index] or row[id_index] == "id":
+                            continue
+                        patents.append(dict(zip(fields, [row[i] for i in indexes])))
             
             # JSONファイルに保存
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(patents, f, indent=2, ensure_ascii=False)
+            _write_json_records(output_file, patents)
             
             self.logger.info(f"CSV to JSON conversion completed: {output_file}")
             return True
@@ -217,35 +348,39 @@ class PatentOrchestrator:
     def run_workflow(self) -> Dict:
         """メインワークフローの実行"""
         start_time = datetime.now()
+        self._timestamp = start_time.strftime(self.config["output"]["timestamp_format"])
+        self._verified_files.clear()
+        self._continue_on_error = self.config["error_handling"]["continue_on_error"]
         self.results["execution_summary"]["start_time"] = start_time.isoformat()
         self.results["execution_summary"]["status"] = "running"
         
         self.logger.info("Starting PatentInsight Orchestrator workflow")
+        components = self.config["components"]
         
         try:
             # ステップ1: CSVからJSONに変換
-            if self.config["components"]["csv_to_json_converter"]["enabled"]:
+            if components["csv_to_json_converter"]["enabled"]:
                 self._run_csv_to_json_converter()
                 result = self.results["component_results"]["csv_to_json_converter"]
                 if result["status"] != "completed":
                     raise Exception(f"CSV to JSON Converter failed: {result.get('error')}")
             
             # ステップ2: Patent Data Fetcher
-            if self.config["components"]["patent_data_fetcher"]["enabled"]:
+            if components["patent_data_fetcher"]["enabled"]:
                 self._run_patent_data_fetcher()
                 result = self.results["component_results"]["patent_data_fetcher"]
                 if result["status"] != "completed":
                     raise Exception(f"Patent Data Fetcher failed: {result.get('error')}")
             
-            # ステップ3: Abstract Integrator (jqベース)
-            if self.config["components"]["abstract_integrator"]["enabled"]:
+            # ステップ3: Abstract Integrator
+            if components["abstract_integrator"]["enabled"]:
                 self._run_abstract_integrator()
                 result = self.results["component_results"]["abstract_integrator"]
                 if result["status"] != "completed":
                     raise Exception(f"Abstract Integrator failed: {result.get('error')}")
             
             # ステップ4: Relevance Scorer
-            if self.config["components"]["relevance_scorer"]["enabled"]:
+            if components["relevance_scorer"]["enabled"]:
                 self._run_relevance_scorer()
                 result = self.results["component_results"]["relevance_scorer"]
                 if result["status"] != "completed":
@@ -351,15 +486,14 @@ class PatentOrchestrator:
         try:
             # 入力ファイルの確認
             csv_file = self.config["input"]["csv_file"]
-            if not Path(csv_file).exists():
-                raise FileNotFoundError(f"Input CSV file not found: {csv_file}")
+            self._require_file(csv_file, "Input CSV file")
             
             # 出力ファイルパス
-            output_file = self._get_timestamped_filename("converted_patents")
-            output_path = Path(self.config["output"]["base_dir"]) / output_file
+            output_path = self._get_output_path("converted_patents")
             
             # CSVからJSONに変換
             if self._convert_csv_to_json(csv_file, str(output_path)):
+                self._verified_files.add(str(output_path))
                 # 結果の記録
                 self.results["component_results"]["csv_to_json_converter"] = {
                     "status": "completed",
@@ -377,7 +511,7 @@ class PatentOrchestrator:
                 "status": "failed",
                 "error": str(e)
             }
-            if not self.config["error_handling"]["continue_on_error"]:
+            if not self._continue_on_error:
                 raise
     
     def _run_patent_data_fetcher(self):
@@ -391,8 +525,7 @@ class PatentOrchestrator:
                 raise Exception("CSV to JSON converter must complete successfully before Patent Data Fetcher")
             
             json_file = converter_result["output_file"]
-            if not Path(json_file).exists():
-                raise FileNotFoundError(f"Converted JSON file not found: {json_file}")
+            self._require_file(json_file, "Converted JSON file")
             
             # 追加: skip_abstract_fetch オプション対応
             if getattr(self, 'skip_abstract_fetch', False):
@@ -411,17 +544,27 @@ class PatentOrchestrator:
                 self.logger.info("Using mock abstract fetching for test mode")
                 patent_data = self._fetch_abstracts_with_mock(json_file)
             else:
-                fetcher = PatentDataFetcher(json_file, abstracts_dir="data/abstracts")
+                # 取得はPatentDataFetcher内で並行実行（同時取得数・間隔・リトライは設定から）
+                fetcher_config = self.config["components"].get("patent_data_fetcher", {})
+                fetcher = PatentDataFetcher(
+                    json_file,
+                    delay=fetcher_config.get("delay", 2),
+                    max_retries=fetcher_config.get("max_retries", 3),
+                    timeout=fetcher_config.get("timeout", 30),
+                    abstracts_dir="data/abstracts",
+                    concurrency=fetcher_config.get("concurrency", 4)
+                )
                 start_number = getattr(self, 'start_number', 1)
                 batch_size = getattr(self, 'batch_size', None)
-                patent_data = fetcher.extract_patent_data(start_number=start_number, batch_size=batch_size)
+                try:
+                    patent_data = fetcher.extract_patent_data(start_number=start_number, batch_size=batch_size)
+                finally:
+                    fetcher.close()
             
             # 結果の保存
-            output_file = self._get_timestamped_filename("patents_with_abstracts")
-            output_path = Path(self.config["output"]["base_dir"]) / output_file
+            output_path = self._get_output_path("patents_with_abstracts")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(patent_data, f, indent=2, ensure_ascii=False)
+            _write_json_records(output_path, patent_data)
             
             # 結果の記録
             self.results["component_results"]["patent_data_fetcher"] = {
@@ -440,7 +583,7 @@ class PatentOrchestrator:
                 "status": "failed",
                 "error": str(e)
             }
-            if not self.config["error_handling"]["continue_on_error"]:
+            if not self._continue_on_error:
                 raise
     
     def _fetch_abstracts_with_mock(self, json_file: str) -> List[Dict]:
@@ -454,55 +597,30 @@ class PatentOrchestrator:
             List[Dict]: アブストラクト付き特許データ
         """
         try:
-            import subprocess
-            
             # 特許データを読み込み
             with open(json_file, 'r', encoding='utf-8') as f:
                 patents = json.load(f)
             
-            # モックアブストラクトデータを読み込み
-            with open(self.mock_abstracts_file, 'r', encoding='utf-8') as f:
-                mock_abstracts = json.load(f)
+            # モックの取得処理はmock_get_abst_patent.pyのものを共用（テストモードでのみ読み込む）
+            if str(MOCK_FETCHER_DIR) not in sys.path:
+                sys.path.insert(0, str(MOCK_FETCHER_DIR))
+            from mock_get_abst_patent import load_abstracts, get_abstract_from_abstracts
+            
+            # モックアブストラクトデータを一度だけ読み込み（特許IDをキーとする辞書）
+            mock_abstracts = load_abstracts(self.mock_abstracts_file)
             
-            # 各特許に対してモックアブストラクト取得を実行
+            # 各特許のモックアブストラクトを読み込み済みの辞書から取得
             enhanced_patents = []
             for patent in patents:
-                patent_id = patent.get("id")
+                abstract_data = get_abstract_from_abstracts(patent.get("id"), mock_abstracts)
                 
-                # モックアブストラクト取得スクリプトを実行
-                cmd = [
-                    sys.executable,
-                    "test/mock_get_abst_patent.py",
-                    patent_id,
-                    self.mock_abstracts_file
-                ]
-                
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    # 成功時
-                    abstract_data = json.loads(result.stdout)
-                    enhanced_patent = patent.copy()
-                    enhanced_patent.update({
-                        "abstract": abstract_data.get("Abstract"),
-                        "abstract_title": abstract_data.get("Title"),
-                        "abstract_url": abstract_data.get("URL"),
-                        "abstract_error": None
-                    })
-                else:
-                    # 失敗時
-                    enhanced_patent = patent.copy()
-                    enhanced_patent.update({
-                        "abstract": None,
-                        "abstract_title": None,
-                        "abstract_url": None,
-                        "abstract_error": result.stderr
-                    })
+                enhanced_patent = patent.copy()
+                enhanced_patent.update({
+                    "abstract": abstract_data.get("Abstract"),
+                    "abstract_title": abstract_data.get("Title"),
+                    "abstract_url": abstract_data.get("URL"),
+                    "abstract_error": abstract_data.get("ErrorMessage") if abstract_data.get("Error") else None
+                })
                 
                 enhanced_patents.append(enhanced_patent)
             
@@ -514,24 +632,22 @@ class PatentOrchestrator:
             raise
     
     def _run_abstract_integrator(self):
-        """Abstract Integrator (jqベース) の実行"""
-        self.logger.info("Running Abstract Integrator (jq-based)")
+        """Abstract Integratorの実行"""
+        self.logger.info("Running Abstract Integrator")
         
         try:
             # 入力ファイルの確認
             csv_file = self.config["input"]["csv_file"]
-            abstracts_dir = "data/abstracts"  # 個別ファイル管理のディレクトリ
+            abstracts_dir = "data/abstracts"  # アブストラクトのキャッシュDBのディレクトリ
             
-            if not Path(csv_file).exists():
-                raise FileNotFoundError(f"Input CSV file not found: {csv_file}")
-            if not Path(abstracts_dir).exists():
+            self._require_file(csv_file, "Input CSV file")
+            if not os.path.isdir(abstracts_dir):
                 self.logger.warning(f"Abstracts directory not found: {abstracts_dir}, creating...")
-                Path(abstracts_dir).mkdir(parents=True, exist_ok=True)
+                os.makedirs(abstracts_dir, exist_ok=True)
             
             # Abstract Integratorの実行
             integrator = AbstractIntegrator(self.config["components"]["abstract_integrator"])
-            output_file = self._get_timestamped_filename("integrated_patents")
-            output_path = Path(self.config["output"]["base_dir"]) / output_file
+            output_path = self._get_output_path("integrated_patents")
             
             result = integrator.process(csv_file, abstracts_dir, str(output_path))
             
@@ -550,7 +666,7 @@ class PatentOrchestrator:
                 self.logger.info(f"Abstract Integrator completed: {result['processed_count']} patents integrated")
             else:
                 self.logger.error(f"Abstract Integrator failed: {result['errors']}")
-                if not self.config["error_handling"]["continue_on_error"]:
+                if not self._continue_on_error:
                     raise Exception(f"Abstract Integrator failed: {result['errors']}")
             
         except Exception as e:
@@ -559,7 +675,7 @@ class PatentOrchestrator:
                 "status": "failed",
                 "error": str(e)
             }
-            if not self.config["error_handling"]["continue_on_error"]:
+            if not self._continue_on_error:
                 raise
     
     def _run_relevance_scorer(self):
@@ -573,8 +689,7 @@ class PatentOrchestrator:
                 raise Exception("Abstract Integrator must complete successfully before Relevance Scorer")
             
             input_file = abstract_integrator_result["output_file"]
-            if not Path(input_file).exists():
-                raise FileNotFoundError(f"Integrated patents file not found: {input_file}")
+            self._require_file(input_file, "Integrated patents file")
             
             # Relevance Scorerの実行
             keywords_file = self.scoring_keywords_file or self.config["components"]["relevance_scorer"]["keywords_file"]
@@ -586,30 +701,29 @@ class PatentOrchestrator:
             scored_data = scorer.calculate_relevance_scores(patent_data)
             
             # 結果の保存（元の順序）
-            output_file = self._get_timestamped_filename("scored_patents")
-            output_path = Path(self.config["output"]["base_dir"]) / output_file
+            output_path = self._get_output_path("scored_patents")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(scored_data, f, indent=2, ensure_ascii=False)
+            _write_json_records(output_path, scored_data)
             
             # スコア順にソートしたデータの作成と保存
             # NaNスコアを除外してソート
-            valid_scored_data = [p for p in scored_data if not (isinstance(p.get("relevance_score"), float) and math.isnan(p.get("relevance_score")))]
-            sorted_scored_data = sorted(valid_scored_data, key=lambda x: x.get("relevance_score", 0), reverse=True)
+            sorted_scored_data = _sort_by_score(scored_data)
             
             # ソート済みファイルの保存
-            sorted_output_file = self._get_timestamped_filename("scored_patents_sorted")
-            sorted_output_path = Path(self.config["output"]["base_dir"]) / sorted_output_file
+            sorted_output_path = self._get_output_path("scored_patents_sorted")
+            
+            _write_json_records(sorted_output_path, sorted_scored_data)
             
-            with open(sorted_output_path, 'w', encoding='utf-8') as f:
-                json.dump(sorted_scored_data, f, indent=2, ensure_ascii=False)
+            # ソート済みデータと関連度別の件数を最終結果の生成用に保持
+            self._sorted_scored = sorted_scored_data
+            self._relevance_counts = _count_relevance(sorted_scored_data)
             
             # 結果の記録
             self.results["component_results"]["relevance_scorer"] = {
                 "status": "completed",
                 "processed_count": len(scored_data),
                 "scored_count": len(scored_data),
-                "valid_scored_count": len(valid_scored_data),
+                "valid_scored_count": len(sorted_scored_data),
                 "output_file": str(output_path),
                 "sorted_output_file": str(sorted_output_path)
             }
@@ -623,7 +737,7 @@ class PatentOrchestrator:
                 "status": "failed",
                 "error": str(e)
             }
-            if not self.config["error_handling"]["continue_on_error"]:
+            if not self._continue_on_error:
                 raise
     
     def _generate_final_results(self):
@@ -632,23 +746,27 @@ class PatentOrchestrator:
             scorer_result = self.results["component_results"].get("relevance_scorer", {})
             if scorer_result.get("status") != "completed":
                 return
-            output_file = scorer_result["output_file"]
-            with open(output_file, 'r', encoding='utf-8') as f:
-                scored_data = json.load(f)
-            # NaNを除外したスコアリスト
-            valid_scored = [p for p in scored_data if not (isinstance(p.get("relevance_score"), float) and math.isnan(p.get("relevance_score")))]
-            nan_count = len(scored_data) - len(valid_scored)
-            total_patents = len(scored_data)
-            high_relevance = sum(1 for p in valid_scored if p.get("relevance_score", 0) >= 30)
-            medium_relevance = sum(1 for p in valid_scored if 10 <= p.get("relevance_score", 0) < 30)
-            low_relevance = sum(1 for p in valid_scored if p.get("relevance_score", 0) < 10)
-            # 上位特許の抽出（NaN除外）
-            top_patents = sorted(valid_scored, key=lambda x: x.get("relevance_score", 0), reverse=True)[:10]
+            # NaNを除外し、スコア降順に並べたリストと関連度別の件数はスコアリング時のものを使用
+            # （保存済みファイルの再読み込みと再ソートを避ける）
+            valid_scored = self._sorted_scored
+            relevance_counts = self._relevance_counts
+            if valid_scored is None or relevance_counts is None:
+                # ファイルから読み込んだ場合は全体をソートせず、上位10件のみヒープで抽出
+                with open(scorer_result["output_file"], 'r', encoding='utf-8') as f:
+                    scored_data = json.load(f)
+                total_patents = len(scored_data)
+                valid_scored = _drop_nan_scores(scored_data)
+                relevance_counts = _count_relevance(valid_scored, presorted=False)
+                top_patents = heapq.nlargest(10, valid_scored, key=_score_key)
+            else:
+                total_patents = scorer_result["scored_count"]
+                top_patents = valid_scored[:10]
+            nan_count = total_patents - len(valid_scored)
             self.results["final_results"] = {
                 "total_patents": total_patents,
-                "high_relevance_count": high_relevance,
-                "medium_relevance_count": medium_relevance,
-                "low_relevance_count": low_relevance,
+                "high_relevance_count": relevance_counts["high"],
+                "medium_relevance_count": relevance_counts["medium"],
+                "low_relevance_count": relevance_counts["low"],
                 "nan_score_count": nan_count,
                 "top_patents": [
                     {
@@ -670,14 +788,14 @@ class PatentOrchestrator:
     def save_results(self, output_file: Optional[str] = None):
         """結果をJSONファイルに保存"""
         if output_file is None:
-            output_file = self._get_timestamped_filename("orchestrator_results")
-            output_path = Path(self.config["output"]["base_dir"]) / output_file
+            output_path = self._get_output_path("orchestrator_results")
         else:
             output_path = Path(output_file)
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.results, f, indent=2, ensure_ascii=False)
+            # 実行結果ファイルの整形は設定で無効化可能（機械処理のみの場合はindent_results: false）
+            _write_json_document(output_path, self.results,
+                                 indent=self.config["output"].get("indent_results", True))
             
             self.logger.info(f"Results saved to: {output_path}")
             return str(output_path)
@@ -689,13 +807,16 @@ class PatentOrchestrator:
     def create_sorted_scored_file(self, input_file: str, output_file: Optional[str] = None) -> str:
         """既存のスコアリング結果ファイルからスコア順にソートしたファイルを生成"""
         try:
-            # 入力ファイルの読み込み
-            with open(input_file, 'r', encoding='utf-8') as f:
-                scored_data = json.load(f)
+            # 入力ファイルを1件ずつ読み込み、NaNスコアの特許は保持せずに除外
+            total_count = 0
+            sorted_scored_data = []
+            for patent in _iter_json_records(input_file):
+                total_count += 1
+                if (score := patent.get("relevance_score")) == score:
+                    sorted_scored_data.append(patent)
             
-            # NaNスコアを除外してソート
-            valid_scored_data = [p for p in scored_data if not (isinstance(p.get("relevance_score"), float) and math.isnan(p.get("relevance_score")))]
-            sorted_scored_data = sorted(valid_scored_data, key=lambda x: x.get("relevance_score", 0), reverse=True)
+            # スコアの降順にソート
+            sorted_scored_data.sort(key=_score_key, reverse=True)
             
             # 出力ファイル名の決定
             if output_file is None:
@@ -703,11 +824,10 @@ class PatentOrchestrator:
                 output_file = input_path.parent / f"{input_path.stem}_sorted{input_path.suffix}"
             
             # ソート済みファイルの保存
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(sorted_scored_data, f, indent=2, ensure_ascii=False)
+            _write_json_records(output_file, sorted_scored_data)
             
             self.logger.info(f"Sorted scored file created: {output_file}")
-            self.logger.info(f"Total patents: {len(scored_data)}, Valid patents: {len(valid_scored_data)}")
+            self.logger.info(f"Total patents: {total_count}, Valid patents: {len(sorted_scored_data)}")
             
             return str(output_file)
             
@@ -738,10 +858,10 @@ class PatentOrchestrator:
             for patent in final_results.get("top_patents", [])[:10]:
                 print(f"{patent['ranking']}. {patent['patent_id']} (Score: {patent['relevance_score']})")
                 print(f"   {patent['title']}")
-                if patent.get('abstract'):
+                abstract = patent.get('abstract')
+                if abstract:
                     # abstractの最初の200文字を表示（長すぎる場合は省略）
-                    abstract_preview = patent['abstract'][:200] + "..." if len(patent['abstract']) > 200 else patent['abstract']
-                    print(f"   Abstract: {abstract_preview}")
+                    print(f"   Abstract: {abstract[:200]}{'...' if len(abstract) > 200 else ''}")
                 print()
         
         if self.results["error_log"]:
@@ -749,8 +869,8 @@ class PatentOrchestrator:
             for error in self.results["error_log"][:5]:  # 最初の5件のみ表示
                 print(f"  - {error}")
 
-def main():
-    """コマンドライン実行用のメイン関数"""
+def build_arg_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数のパーサーを作成"""
     parser = argparse.ArgumentParser(description="PatentInsight Orchestrator")
     parser.add_argument("--input", "-i", required=False,
                        help="Input CSV file path")
@@ -762,6 +882,8 @@ def main():
                        help="Number of top patents to display")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Verbose output")
+    parser.add_argument("--no-summary", action="store_true",
+                       help="Do not print the result summary (results are still saved to JSON)")
     parser.add_argument("--test", "-t", choices=["csv-converter", "data-fetcher", "abstract-integrator", "relevance-scorer", "all"],
                        help="Test individual components")
     parser.add_argument("--test-mode", action="store_true",
@@ -775,8 +897,18 @@ def main():
     parser.add_argument("--skip_abstract_fetch", action="store_true", help="Skip abstract fetching and proceed with empty abstracts")
     parser.add_argument("--sort-scored-file", type=str, help="Create sorted version of existing scored patents file")
     parser.add_argument("--scoring-keywords", type=str, help="Scoring keywords JSON file (evaluation keywords)")
+    return parser
+
+def main(args: Optional[argparse.Namespace] = None):
+    """
+    コマンドライン実行用のメイン関数
     
-    args = parser.parse_args()
+    Args:
+        args: 解析済みの引数（Noneならコマンドラインから解析）。
+              他のスクリプトからプロセス内で呼び出す場合に使用
+    """
+    if args is None:
+        args = build_arg_parser().parse_args()
     
     # 設定の準備
     config_overrides = {}
@@ -830,7 +962,8 @@ def main():
                 sys.exit(1)
             results = orchestrator.run_workflow()
             orchestrator.save_results()
-            orchestrator.display_summary()
+            if not args.no_summary:
+                orchestrator.display_summary()
             
             # 終了コード
             sys.exit(0 if results["execution_summary"]["status"] == "completed" else 1)
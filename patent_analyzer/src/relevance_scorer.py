@@ -4,11 +4,22 @@
 RelevanceScorer: アブストラクトが統合された特許データに対し、キーワードベースの関連性スコアを計算する
 """
 
+import heapq
 import json
 import logging
-import re
+import os
 from typing import List, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class RelevanceScorer:
     """キーワードベースの関連性スコアリング"""
@@ -18,12 +29,17 @@ class RelevanceScorer:
         self.config_path = config_path
         self.logger = logging.getLogger(__name__)
         self.keywords_config = self.load_keywords_config()
+        self._prepare_keyword_matcher()
         
     def load_keywords_config(self) -> Dict:
         """キーワード設定ファイルを読み込み"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            if orjson is not None:
+                with open(self.config_path, 'rb') as f:
+                    config = orjson.loads(f.read())
+            else:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
             self.logger.info(f"Loaded keywords configuration from {self.config_path}")
             return config
         except FileNotFoundError:
@@ -36,30 +52,64 @@ class RelevanceScorer:
             self.logger.error(f"Unexpected error loading keywords config: {e}")
             raise
     
+    def _prepare_keyword_matcher(self):
+        """カテゴリ・キーワードを前処理し、全キーワードを1回の走査で照合するオートマトンを構築"""
+        # (カテゴリ名, 重み, キーワード) のタプルと、全カテゴリを平坦化した
+        # (小文字化したキーワード, (カテゴリ番号, キーワード番号)) のタプル
+        # （設定の辞書はここで一度だけ参照し、スコア計算では不変のタプルのみを使う）
+        categories = []
+        flat_keywords = []
+        for category_index, (category_name, category_config) in enumerate(self.keywords_config.get("categories", {}).items()):
+            keywords = tuple(category_config.get("keywords", []))
+            categories.append((category_name, category_config.get("weight", 1.0), keywords))
+            for keyword_index, keyword in enumerate(keywords):
+                flat_keywords.append((keyword.lower(), (category_index, keyword_index)))
+        self._categories = tuple(categories)
+        self._flat_keywords = tuple(flat_keywords)
+        
+        # pyahocorasickが利用可能なら、キーワード→(カテゴリ番号, キーワード番号)のオートマトンを構築
+        # （同じキーワードが複数カテゴリにある場合もすべての位置を保持）
+        self._automaton = None
+        # 空文字列のキーワードは常に一致（オートマトンでは検出されない）
+        self._always_matched = frozenset(position for keyword, position in self._flat_keywords if not keyword)
+        if ahocorasick is None:
+            return
+        positions = {}
+        for keyword, position in self._flat_keywords:
+            if keyword:
+                positions.setdefault(keyword, []).append(position)
+        if positions:
+            automaton = ahocorasick.Automaton()
+            for keyword, keyword_positions in positions.items():
+                automaton.add_word(keyword, keyword_positions)
+            automaton.make_automaton()
+            self._automaton = automaton
+    
     def calculate_relevance_scores(self, patent_data: List[Dict]) -> List[Dict]:
         """
-        関連性スコアを計算
+        関連性スコアを計算（入力と同じ順序で返す。上位の特許はtop_kで取得）
+        
+        各特許の辞書に"relevance_score"を直接追加し、入力のリストをそのまま返す
+        （特許ごとの辞書のコピーは行わない）
         """
-        import math
         self.logger.info(f"Calculating relevance scores for {len(patent_data)} patents")
         
-        scored_data = []
         for patent in patent_data:
             # abstractが空またはNoneの場合はNaN
             abstract = patent.get("abstract", None)
             if abstract is None or (isinstance(abstract, str) and not abstract.strip()):
-                score = float('nan')
+                patent["relevance_score"] = float('nan')
             else:
-                score = self._calculate_patent_score(patent)
-            scored_patent = patent.copy()
-            scored_patent["relevance_score"] = score
-            scored_data.append(scored_patent)
-        
-        # スコア降順でソート（NaNは一番下）
-        scored_data.sort(key=lambda x: (not isinstance(x.get("relevance_score"), float) or not math.isnan(x.get("relevance_score"))), reverse=True)
+                patent["relevance_score"] = self._calculate_patent_score(patent)
         
-        self.logger.info(f"Relevance scoring completed for {len(scored_data)} patents")
-        return scored_data
+        self.logger.info(f"Relevance scoring completed for {len(patent_data)} patents")
+        return patent_data
+    
+    def top_k(self, scored_data: List[Dict], k: int = 10) -> List[Dict]:
+        """スコア上位k件を降順で取得（NaNスコアは除外。全体のソートは行わない）"""
+        # NaNだけが自身と等しくならない
+        valid_scored = (p for p in scored_data if (score := p.get("relevance_score")) == score)
+        return heapq.nlargest(k, valid_scored, key=lambda p: p.get("relevance_score", 0))
     
     def _calculate_patent_score(self, patent: Dict) -> int:
         """個別特許のスコアを計算"""
@@ -70,35 +120,41 @@ class RelevanceScorer:
         # テキストを結合して小文字に変換
         combined_text = f"{title} {abstract}".lower()
         
-        total_score = 0
-        matched_keywords = []
-        
-        # 新しい設定ファイル構造に対応
-        categories = self.keywords_config.get("categories", {})
+        # 一致したキーワードの位置 (カテゴリ番号, キーワード番号) を集める
+        # （大文字小文字を区別しない。出現回数はスコアに影響しない）
+        if self._automaton is not None:
+            # オートマトンでテキストを1回だけ走査
+            matched_positions = set(self._always_matched)
+            for _, keyword_positions in self._automaton.iter(combined_text):
+                matched_positions.update(keyword_positions)
+        else:
+            matched_positions = {position for keyword, position in self._flat_keywords if keyword in combined_text}
+        
+        # どのキーワードにも一致しない特許はカテゴリごとの集計を省略
+        if not matched_positions:
+            return 0
+        
+        # カテゴリごとの一致キーワード数
+        category_matches = [0] * len(self._categories)
+        for category_index, _ in matched_positions:
+            category_matches[category_index] += 1
         
-        for category_name, category_config in categories.items():
-            keywords = category_config.get("keywords", [])
-            weight = category_config.get("weight", 1.0)
-            
-            category_matches = 0
-            for keyword in keywords:
-                # キーワードの出現回数をカウント（大文字小文字を区別しない）
-                pattern = re.compile(re.escape(keyword.lower()), re.IGNORECASE)
-                matches = len(pattern.findall(combined_text))
-                
-                if matches > 0:
-                    category_matches += 1
-                    matched_keywords.append(f"{keyword} ({category_name})")
-            
+        total_score = 0
+        for (category_name, weight, _), matches in zip(self._categories, category_matches):
             # カテゴリのスコアを加算（重みを適用）
-            category_total = category_matches * weight * 10  # 重みを10倍して整数スコアに
+            category_total = matches * weight * 10  # 重みを10倍して整数スコアに
             total_score += category_total
             
-            if category_matches > 0:
-                self.logger.debug(f"Category '{category_name}': {category_matches} keywords matched, score: {category_total}")
+            if matches > 0:
+                # 文字列の整形はDEBUGログが実際に出力される場合のみ行われる
+                self.logger.debug("Category '%s': %s keywords matched, score: %s", category_name, matches, category_total)
         
-        if matched_keywords:
-            self.logger.debug(f"Patent {patent.get('id', 'Unknown')}: matched keywords: {', '.join(matched_keywords)}")
+        if matched_positions and self.logger.isEnabledFor(logging.DEBUG):
+            matched_keywords = [
+                f"{self._categories[category_index][2][keyword_index]} ({self._categories[category_index][0]})"
+                for category_index, keyword_index in sorted(matched_positions)
+            ]
+            self.logger.debug("Patent %s: matched keywords: %s", patent.get('id', 'Unknown'), ', '.join(matched_keywords))
         
         return int(total_score)
     
@@ -107,7 +163,10 @@ class RelevanceScorer:
         if not scored_data:
             return {}
         
-        scores = [patent.get("relevance_score", 0) for patent in scored_data]
+        # NaNスコア（アブストラクトなし）は統計から除外（結果の並び順に依存しないように）
+        scores = [score for patent in scored_data if (score := patent.get("relevance_score", 0)) == score]
+        if not scores:
+            return {"total_patents": len(scored_data)}
         
         return {
             "total_patents": len(scored_data),
@@ -119,13 +178,23 @@ class RelevanceScorer:
         }
     
     def save_scored_data(self, scored_data: List[Dict], output_path: str):
-        """スコア付きデータをJSONファイルに保存"""
+        """スコア付きデータをJSONファイルに保存（1件1行のJSON配列。一時ファイルに書き出してから置き換え）"""
+        # orjsonはNaNスコアをnullに変換してしまうため、標準のjsonモジュールで1件ずつ書き出す
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        tmp_path = f"{output_path}.tmp"
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(scored_data, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write('[')
+                f.writelines((',\n' if i else '\n') + encode(patent) for i, patent in enumerate(scored_data))
+                f.write('\n]')
+            os.replace(tmp_path, output_path)
             self.logger.info(f"Scored data saved to {output_path}")
         except Exception as e:
             self.logger.error(f"Failed to save scored data: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             raise
 
 
@@ -154,7 +223,7 @@ if __name__ == "__main__":
         
         # 上位10件を表示
         print("\nTop 10 Most Relevant Patents:")
-        for i, patent in enumerate(scored_data[:10], 1):
+        for i, patent in enumerate(scorer.top_k(scored_data), 1):
             print(f"{i}. {patent.get('id', 'Unknown')} (Score: {patent.get('relevance_score', 0)})")
             print(f"   Title: {patent.get('title', 'N/A')}")
             print()
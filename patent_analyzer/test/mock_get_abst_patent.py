@@ -6,21 +6,84 @@ Mock Abstract Patent Fetcher - テスト用のアブストラクト取得スク
 アブストラクトを取得します。本番のget_abst_patent.pyと同じ出力形式を返します。
 """
 
+import functools
 import json
+import os
 import sys
 import logging
 from pathlib import Path
 
-# ログ設定
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=4)
+def _load_abstracts_cached(abstracts_file: str, mtime_ns: int) -> dict:
+    """アブストラクトデータファイルをバイト列のまま読み込んで解析（パスと更新時刻ごとにキャッシュ）"""
+    data = Path(abstracts_file).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def load_abstracts(abstracts_file: str) -> dict:
+    """
+    アブストラクトデータファイルを読み込み（orjsonが利用可能ならorjsonを使用）
+    
+    同じプロセス内では、ファイルが更新されない限り前回の解析結果を再利用します。
+    
+    Args:
+        abstracts_file: アブストラクトデータファイルパス
+        
+    Returns:
+        dict: アブストラクトデータ（特許ID → アブストラクト情報）
+    """
+    return _load_abstracts_cached(str(abstracts_file), os.stat(abstracts_file).st_mtime_ns)
+
+def get_abstract_from_abstracts(patent_id: str, abstracts: dict) -> dict:
+    """
+    読み込み済みのテストデータからアブストラクトを取得
+    
+    Args:
+        patent_id: 特許ID
+        abstracts: アブストラクトデータ（特許ID → アブストラクト情報）
+        
+    Returns:
+        dict: アブストラクト情報（get_abst_patent.pyと同じ形式）
+    """
+    # 指定された特許IDのデータを取得
+    if patent_id in abstracts:
+        abstract_data = abstracts[patent_id]
+        return {
+            "ID": patent_id,
+            "Title": abstract_data.get("title"),
+            "Abstract": abstract_data.get("abstract"),
+            "URL": abstract_data.get("url"),
+            "Error": None,
+            "ErrorCode": None,
+            "ErrorMessage": None,
+            "RetryCount": 0,
+            "Timestamp": None
+        }
+    else:
+        # 特許IDが見つからない場合
+        return {
+            "ID": patent_id,
+            "Title": None,
+            "Abstract": None,
+            "URL": None,
+            "Error": "NOT_FOUND",
+            "ErrorCode": "404",
+            "ErrorMessage": f"Patent ID {patent_id} not found in test data",
+            "RetryCount": 0,
+            "Timestamp": None
+        }
+
 def get_abstract_from_test_data(patent_id: str, abstracts_file: str) -> dict:
     """
-    テストデータからアブストラクトを取得
+    テストデータファイルからアブストラクトを取得
     
     Args:
         patent_id: 特許ID
@@ -31,36 +94,9 @@ def get_abstract_from_test_data(patent_id: str, abstracts_file: str) -> dict:
     """
     try:
         # アブストラクトデータを読み込み
-        with open(abstracts_file, 'r', encoding='utf-8') as f:
-            abstracts = json.load(f)
+        abstracts = load_abstracts(abstracts_file)
         
-        # 指定された特許IDのデータを取得
-        if patent_id in abstracts:
-            abstract_data = abstracts[patent_id]
-            return {
-                "ID": patent_id,
-                "Title": abstract_data.get("title"),
-                "Abstract": abstract_data.get("abstract"),
-                "URL": abstract_data.get("url"),
-                "Error": None,
-                "ErrorCode": None,
-                "ErrorMessage": None,
-                "RetryCount": 0,
-                "Timestamp": None
-            }
-        else:
-            # 特許IDが見つからない場合
-            return {
-                "ID": patent_id,
-                "Title": None,
-                "Abstract": None,
-                "URL": None,
-                "Error": "NOT_FOUND",
-                "ErrorCode": "404",
-                "ErrorMessage": f"Patent ID {patent_id} not found in test data",
-                "RetryCount": 0,
-                "Timestamp": None
-            }
+        return get_abstract_from_abstracts(patent_id, abstracts)
             
     except FileNotFoundError:
         logger.error(f"Abstracts file not found: {abstracts_file}")
@@ -104,6 +140,12 @@ def get_abstract_from_test_data(patent_id: str, abstracts_file: str) -> dict:
 
 def main():
     """メイン関数"""
+    # ログ設定（patent_orchestratorからインポートされた場合は呼び出し側の設定に従う）
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     if len(sys.argv) != 3:
         print("Usage: python mock_get_abst_patent.py <patent_id> <abstracts_json_file>")
         print("Example: python mock_get_abst_patent.py US-9254383-B2 ../data/test_data/sample_abstracts.json")
@@ -10,12 +10,26 @@ Test Abstract Fetching - CSVから変換されたJSONを使ってアブストラ
 
 import json
 import sys
-import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# モックアブストラクト取得スクリプトを同じディレクトリからインポート
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import mock_get_abst_patent
+
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -26,7 +40,8 @@ logger = logging.getLogger(__name__)
 class AbstractFetchingTester:
     """アブストラクト取得のテストクラス"""
     
-    def __init__(self, patents_json_path: str, abstracts_json_path: str, output_dir: str = "test_output"):
+    def __init__(self, patents_json_path: str, abstracts_json_path: str, output_dir: str = "test_output",
+                 max_workers: int = 4):
         """
         初期化
         
@@ -34,9 +49,11 @@ class AbstractFetchingTester:
             patents_json_path: 特許データJSONファイルパス
             abstracts_json_path: アブストラクトデータJSONファイルパス
             output_dir: 出力ディレクトリ
+            max_workers: アブストラクト取得の並列数
         """
         self.patents_json_path = patents_json_path
         self.abstracts_json_path = abstracts_json_path
+        self.max_workers = max(1, max_workers)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
@@ -58,18 +75,41 @@ class AbstractFetchingTester:
             "patent_results": [],
             "errors": []
         }
+        
+        # アブストラクトデータは一度だけ読み込み、各特許の取得で共有
+        self._abstracts = self._load_abstracts()
+    
+    def _load_abstracts(self) -> Optional[Dict[str, Any]]:
+        """アブストラクトデータを読み込み（失敗時はNone。各特許の取得結果としてエラーを返す）"""
+        try:
+            return mock_get_abst_patent.load_abstracts(self.abstracts_json_path)
+        except Exception as e:
+            logger.error(f"Failed to load abstracts: {e}")
+            return None
     
     def load_patents(self) -> List[Dict[str, Any]]:
         """特許データを読み込み"""
         try:
-            with open(self.patents_json_path, 'r', encoding='utf-8') as f:
-                patents = json.load(f)
+            if orjson is not None:
+                with open(self.patents_json_path, 'rb') as f:
+                    patents = orjson.loads(f.read())
+            else:
+                with open(self.patents_json_path, 'r', encoding='utf-8') as f:
+                    patents = json.load(f)
             logger.info(f"Loaded {len(patents)} patents from {self.patents_json_path}")
             return patents
         except Exception as e:
             logger.error(f"Failed to load patents: {e}")
             raise
     
+    def iter_patents(self) -> Iterator[Dict[str, Any]]:
+        """特許データを1件ずつ読み込み（ijsonが利用可能ならファイル全体をメモリに載せない）"""
+        if ijson is None:
+            yield from self.load_patents()
+            return
+        with open(self.patents_json_path, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    
     def fetch_abstract_for_patent(self, patent_id: str) -> Dict[str, Any]:
         """
         単一の特許に対してアブストラクト取得を実行
@@ -81,24 +121,15 @@ class AbstractFetchingTester:
             dict: アブストラクト取得結果
         """
         try:
-            # モックアブストラクト取得スクリプトを実行
-            cmd = [
-                sys.executable, 
-                "test/mock_get_abst_patent.py",
-                patent_id,
-                self.abstracts_json_path
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # モックアブストラクト取得を同じプロセス内で実行（読み込み済みのデータを使用）
+            if self._abstracts is not None:
+                abstract_data = mock_get_abst_patent.get_abstract_from_abstracts(patent_id, self._abstracts)
+            else:
+                # 読み込みに失敗した場合はファイルから取得し、エラー内容を結果として受け取る
+                abstract_data = mock_get_abst_patent.get_abstract_from_test_data(patent_id, self.abstracts_json_path)
             
-            if result.returncode == 0:
+            if not abstract_data.get("Error"):
                 # 成功時
-                abstract_data = json.loads(result.stdout)
                 return {
                     "patent_id": patent_id,
                     "status": "success",
@@ -111,16 +142,9 @@ class AbstractFetchingTester:
                     "patent_id": patent_id,
                     "status": "failed",
                     "abstract_data": None,
-                    "error": result.stderr
+                    "error": f"{abstract_data.get('Error')} - {abstract_data.get('ErrorMessage')}"
                 }
                 
-        except subprocess.TimeoutExpired:
-            return {
-                "patent_id": patent_id,
-                "status": "timeout",
-                "abstract_data": None,
-                "error": "Timeout while fetching abstract"
-            }
         except Exception as e:
             return {
                 "patent_id": patent_id,
@@ -137,30 +161,32 @@ class AbstractFetchingTester:
         logger.info("Starting abstract fetching test")
         
         try:
-            # 特許データを読み込み
-            patents = self.load_patents()
-            self.results["summary"]["total_patents"] = len(patents)
-            
-            # 各特許に対してアブストラクト取得を実行
-            for i, patent in enumerate(patents, 1):
+            # 特許データを1件ずつ読み込み、IDのある特許のみ取得対象にする（IDのみ保持）
+            total = 0
+            patent_ids = []
+            for patent in self.iter_patents():
+                total += 1
                 patent_id = patent.get("id")
                 if not patent_id:
-                    logger.warning(f"Patent {i} has no ID, skipping")
+                    logger.warning(f"Patent {total} has no ID, skipping")
                     continue
-                
-                logger.info(f"Fetching abstract {i}/{len(patents)}: {patent_id}")
-                
-                # アブストラクト取得
-                result = self.fetch_abstract_for_patent(patent_id)
-                self.results["patent_results"].append(result)
-                
-                # 統計更新
+                patent_ids.append(patent_id)
+            self.results["summary"]["total_patents"] = total
+            
+            # 各特許に対してアブストラクト取得を並列実行（結果は元の順序で受け取る）
+            logger.info(f"Fetching abstracts for {len(patent_ids)} patents ({self.max_workers} workers)")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                patent_results = list(executor.map(self.fetch_abstract_for_patent, patent_ids))
+            self.results["patent_results"].extend(patent_results)
+            
+            # 統計更新
+            for result in patent_results:
                 if result["status"] == "success":
                     self.results["summary"]["successful_fetches"] += 1
                 else:
                     self.results["summary"]["failed_fetches"] += 1
                     self.results["errors"].append({
-                        "patent_id": patent_id,
+                        "patent_id": result["patent_id"],
                         "error": result["error"]
                     })
             
@@ -232,9 +258,9 @@ class AbstractFetchingTester:
             for result in successful_results[:3]:  # 最初の3件のみ表示
                 abstract_data = result["abstract_data"]
                 print(f"  - {abstract_data['ID']}: {abstract_data.get('Title', 'N/A')}")
-                if abstract_data.get('Abstract'):
-                    abstract_preview = abstract_data['Abstract'][:100] + "..." if len(abstract_data['Abstract']) > 100 else abstract_data['Abstract']
-                    print(f"    Abstract: {abstract_preview}")
+                abstract = abstract_data.get('Abstract')
+                if abstract:
+                    print(f"    Abstract: {abstract[:100]}{'...' if len(abstract) > 100 else ''}")
 
 def main():
     """メイン関数"""
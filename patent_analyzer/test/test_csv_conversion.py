@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test CSV Conversion - BOM付きCSVの変換テスト
+
+Google PatentsのエクスポートCSVが先頭にUTF-8のBOMを含む場合でも、
+BOMなしと同じJSONに変換されることを、pandas・csvモジュールの両方の経路で確認します。
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# src配下のモジュールをインポート
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import patent_orchestrator
+from patent_orchestrator import PatentOrchestrator
+
+# テスト用CSV（リポジトリのテストデータ）
+SAMPLE_CSV = Path(__file__).resolve().parent.parent / "data" / "test_data" / "sample_patents.csv"
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class CsvBomConversionTest(unittest.TestCase):
+    """BOM付きCSVとBOMなしCSVの変換結果が一致することのテスト"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # オーケストレーターはカレントディレクトリにlogsを作成するため一時ディレクトリで実行
+        self.original_cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        self.orchestrator = PatentOrchestrator(
+            output={"base_dir": self.temp_dir.name},
+            logging={"file": None, "console": False}
+        )
+        self.csv_bytes = SAMPLE_CSV.read_bytes()
+        self.original_pd = patent_orchestrator.pd
+
+    def tearDown(self):
+        patent_orchestrator.pd = self.original_pd
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def _convert(self, name: str, content: bytes):
+        """CSVを書き出して変換し、変換後の特許データを返す"""
+        csv_path = os.path.join(self.temp_dir.name, f"{name}.csv")
+        json_path = os.path.join(self.temp_dir.name, f"{name}.json")
+        with open(csv_path, 'wb') as f:
+            f.write(content)
+        self.assertTrue(self.orchestrator._convert_csv_to_json(csv_path, json_path))
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _assert_bom_ignored(self, content: bytes):
+        plain = self._convert("plain", content)
+        with_bom = self._convert("bom", UTF8_BOM + content)
+        self.assertTrue(plain)
+        self.assertEqual(with_bom, plain)
+        self.assertEqual(set(with_bom[0]), {field for field, _ in patent_orchestrator.CSV_COLUMN_MAP})
+
+    def test_bom_with_csv_module(self):
+        """csvモジュールでの変換でBOMを無視する"""
+        patent_orchestrator.pd = None
+        self._assert_bom_ignored(self.csv_bytes)
+
+    def test_bom_with_search_url_line_with_csv_module(self):
+        """先頭が"search URL:"行の場合もBOMを無視する（csvモジュール）"""
+        patent_orchestrator.pd = None
+        self._assert_bom_ignored(b"search URL:,https://patents.google.com/?q=test\n" + self.csv_bytes)
+
+    @unittest.skipIf(patent_orchestrator.pd is None, "pandas is not installed")
+    def test_bom_with_pandas(self):
+        """pandasでの変換でBOMを無視し、csvモジュールと同じ結果になる"""
+        with_pandas = self._convert("pandas", UTF8_BOM + self.csv_bytes)
+        patent_orchestrator.pd = None
+        self.assertEqual(with_pandas, self._convert("csv_module", UTF8_BOM + self.csv_bytes))
+
+    @unittest.skipIf(patent_orchestrator.pd is None, "pandas is not installed")
+    def test_bom_with_search_url_line_with_pandas(self):
+        """先頭が"search URL:"行の場合もBOMを無視する（pandas）"""
+        self._assert_bom_ignored(b"search URL:,https://patents.google.com/?q=test\n" + self.csv_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test Get Abst Patent - 本文受信中の読み取りタイムアウトの扱いを確認するテスト
+
+ヘッダー送信後に本文の途中で応答が止まるローカルHTTPサーバーを使い、
+ストリーミング中の読み取りタイムアウトが requests.ConnectionError ではなく
+requests.Timeout として呼び出し元に伝わることを確認します。
+"""
+
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# src配下のモジュールをインポート
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from get_abst_patent import create_session, fetch_one, fetch_page_prefix
+
+# クライアント側の読み取りタイムアウト（秒）とサーバー側の停止時間（秒）
+READ_TIMEOUT = 0.3
+STALL_SECONDS = 2.0
+
+
+class StallingHandler(BaseHTTPRequestHandler):
+    """本文の先頭だけ送って応答を止めるハンドラー（/ok は本文を最後まで送る）"""
+
+    body = b"<html><head><title>US1234567A - Test</title></head><body>" + b"x" * 1024
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        if self.path == "/ok":
+            self.wfile.write(self.body)
+            return
+        self.wfile.write(self.body[:64])
+        self.wfile.flush()
+        time.sleep(STALL_SECONDS)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MidStreamTimeoutTest(unittest.TestCase):
+    """本文受信中の読み取りタイムアウトのテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StallingHandler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.session = create_session()
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_mid_stream_timeout_raises_timeout(self):
+        """本文の途中で止まった場合はrequests.Timeout（ConnectionErrorではない）"""
+        with self.assertRaises(requests.Timeout) as context:
+            fetch_page_prefix(f"{self.base_url}/stall", timeout=READ_TIMEOUT, session=self.session)
+        self.assertNotIsInstance(context.exception, requests.ConnectionError)
+
+    def test_fetch_one_reports_timeout(self):
+        """fetch_oneからもrequests.Timeoutとして伝わる"""
+        with self.assertRaises(requests.Timeout):
+            fetch_one(f"{self.base_url}/stall", timeout=READ_TIMEOUT, session=self.session)
+
+    def test_complete_response_is_returned(self):
+        """本文を最後まで受信できた場合はそのまま返す"""
+        content = fetch_page_prefix(f"{self.base_url}/ok", timeout=READ_TIMEOUT, session=self.session)
+        self.assertEqual(content, StallingHandler.body)
+
+
+if __name__ == "__main__":
+    unittest.main()
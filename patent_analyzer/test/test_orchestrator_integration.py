@@ -4,17 +4,45 @@ Test Orchestrator Integration - オーケストレーターの統合テスト
 
 テストデータを使ってPatent Orchestratorの全体的なワークフローをテストします。
 実際のWebアクセスを避けるため、モックコンポーネントを使用します。
+
+既定では毎回オーケストレーターを実行します。環境変数 TORIR_ORCH_CACHE=1 を設定すると、
+入力・設定・src配下のソースが前回と同じで、前回の出力ファイルがそのまま残っている場合に
+限り <output_dir>/orch_cache の実行結果を再利用します（開発中の繰り返し実行向け）。
+
+テスト用設定ファイルはコンパクト形式で書き出します（TORIR_PRETTY_JSON を設定すると
+整形して出力）。--compact を指定すると結果ファイルもコンパクト形式で保存します。
 """
 
+import hashlib
 import json
+import os
 import sys
 import subprocess
+import threading
+import time
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +50,100 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ijson.parseが返す値イベント（配列要素の数え上げに使用）
+_VALUE_START_EVENTS = frozenset(
+    ("start_map", "start_array", "string", "number", "boolean", "null")
+)
+
+
+# linux/fs.h の FICLONE（btrfs/XFSなどでエクステントを共有したコピーを作る）
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy_range(source: Path, target: Path):
+    """FICLONEでのクローン、できなければcopy_file_rangeでカーネル内コピー"""
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                return
+            except OSError:
+                pass
+        if not hasattr(os, "copy_file_range"):
+            raise OSError("copy_file_range is not available")
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
+
+def _fast_copy(source: Path, target: Path):
+    """テストデータをコピー（カーネル内コピーができない場合はshutil.copy2）"""
+    try:
+        _clone_or_copy_range(source, target)
+        shutil.copystat(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _remove_dirs(dir_paths: List[Path]):
+    """ディレクトリをまとめて削除（クリーンアップ用スレッドから呼び出される）"""
+    for dir_path in dir_paths:
+        shutil.rmtree(dir_path, ignore_errors=True)
+
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """JSONをUTF-8のバイト列に変換（orjsonがあればそちらを使用）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+
+def _read_tail(path: Path, limit: int = 4096) -> str:
+    """ファイル末尾のlimitバイトをテキストとして取得"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - limit))
+        return f.read().decode('utf-8', errors='replace')
+
+
+def _summarize_json_stream(file_path: Path) -> Dict[str, Any]:
+    """ijsonでトップレベルの要素数とキーだけをストリーミングで取得"""
+    with open(file_path, 'rb') as f:
+        events = ijson.parse(f)
+        _, root_event, _ = next(events)
+        if root_event == "start_array":
+            count = sum(1 for prefix, event, _ in events
+                        if prefix == "item" and event in _VALUE_START_EVENTS)
+            return {"type": "json", "size": count, "keys": None}
+        if root_event == "start_map":
+            keys = [value for prefix, event, value in events
+                    if prefix == "" and event == "map_key"]
+            return {"type": "json", "size": 1, "keys": keys}
+        return {"type": "json", "size": 1, "keys": None}
+
+
+def _summarize_json(file_path: Path) -> Dict[str, Any]:
+    """JSONファイルのサイズとトップレベルキーを取得（ijsonが使えない場合はjson.load）"""
+    if ijson is not None:
+        try:
+            return _summarize_json_stream(file_path)
+        except Exception:
+            # NaNを含むスコア付きデータなどijsonで読めないものはjson.loadに任せる
+            pass
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {
+        "type": "json",
+        "size": len(data) if isinstance(data, list) else 1,
+        "keys": list(data.keys()) if isinstance(data, dict) else None
+    }
+
+
 class OrchestratorIntegrationTester:
     """オーケストレーター統合テストクラス"""
     
@@ -56,6 +178,22 @@ class OrchestratorIntegrationTester:
         # テスト用の一時ディレクトリ
         self.temp_dir = self.output_dir / "temp"
         self.temp_dir.mkdir(exist_ok=True)
+        
+        # 繰り返し使うパスは一度だけ組み立てておく
+        self._cwd = Path.cwd()
+        self._csv_path = self.temp_dir / "raw_search_results" / "gp_search_results.csv"
+        self._abstracts_path = self.temp_dir / "sample_abstracts.json"
+        self._processed_dir = self.temp_dir / "processed"
+        self._log_dir = self.temp_dir / "logs"
+        
+        # オーケストレーターの実行コマンド（呼び出しごとに変わるのは--configのみ）
+        self._cmd_base = [
+            sys.executable,
+            "src/patent_orchestrator.py",
+            "--input", str(self._csv_path),
+            "--test-mode",
+            "--mock-abstracts", str(self._abstracts_path)
+        ]
     
     def setup_test_environment(self) -> bool:
         """テスト環境のセットアップ"""
@@ -65,8 +203,8 @@ class OrchestratorIntegrationTester:
             # テスト用のディレクトリ構造を作成
             test_dirs = [
                 self.temp_dir / "raw_search_results",
-                self.temp_dir / "processed",
-                self.temp_dir / "logs"
+                self._processed_dir,
+                self._log_dir
             ]
             
             for dir_path in test_dirs:
@@ -74,23 +212,24 @@ class OrchestratorIntegrationTester:
             
             # テスト用CSVファイルをコピー
             source_csv = self.test_data_dir / "sample_patents.csv"
-            target_csv = self.temp_dir / "raw_search_results" / "gp_search_results.csv"
+            target_csv = self._csv_path
             
-            if source_csv.exists():
-                shutil.copy2(source_csv, target_csv)
+            # 事前にexists()で確認せず、コピーを試みて存在しなければ失敗とする
+            try:
+                _fast_copy(source_csv, target_csv)
                 logger.info(f"Copied test CSV: {target_csv}")
-            else:
+            except FileNotFoundError:
                 logger.warning(f"Test CSV not found: {source_csv}")
                 return False
             
             # テスト用アブストラクトファイルをコピー
             source_abstracts = self.test_data_dir / "sample_abstracts.json"
-            target_abstracts = self.temp_dir / "sample_abstracts.json"
+            target_abstracts = self._abstracts_path
             
-            if source_abstracts.exists():
-                shutil.copy2(source_abstracts, target_abstracts)
+            try:
+                _fast_copy(source_abstracts, target_abstracts)
                 logger.info(f"Copied test abstracts: {target_abstracts}")
-            else:
+            except FileNotFoundError:
                 logger.warning(f"Test abstracts not found: {source_abstracts}")
                 return False
             
@@ -104,11 +243,11 @@ class OrchestratorIntegrationTester:
         """テスト用の設定ファイルを作成"""
         config = {
             "input": {
-                "csv_file": str(self.temp_dir / "raw_search_results" / "gp_search_results.csv"),
+                "csv_file": str(self._csv_path),
                 "encoding": "utf-8"
             },
             "output": {
-                "base_dir": str(self.temp_dir / "processed"),
+                "base_dir": str(self._processed_dir),
                 "timestamp_format": "%Y%m%d_%H%M%S"
             },
             "components": {
@@ -136,7 +275,7 @@ class OrchestratorIntegrationTester:
             },
             "logging": {
                 "level": "INFO",
-                "file": str(self.temp_dir / "logs" / "orchestrator_test.log"),
+                "file": str(self._log_dir / "orchestrator_test.log"),
                 "console": True
             },
             "error_handling": {
@@ -148,8 +287,10 @@ class OrchestratorIntegrationTester:
         }
         
         config_file = self.temp_dir / "test_config.json"
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        with open(config_file, 'wb') as f:
+            # バイト列にしてから一度に書き込む
+            # オーケストレーターが読むだけなので通常はコンパクト形式（TORIR_PRETTY_JSONで整形）
+            f.write(_dumps(config, indent=bool(os.environ.get("TORIR_PRETTY_JSON"))))
         
         logger.info(f"Created test config: {config_file}")
         return str(config_file)
@@ -166,31 +307,47 @@ class OrchestratorIntegrationTester:
         """
         try:
             # モックモードでオーケストレーターを実行
-            cmd = [
-                sys.executable,
-                "src/patent_orchestrator.py",
-                "--input", str(self.temp_dir / "raw_search_results" / "gp_search_results.csv"),
-                "--config", config_file,
-                "--test-mode",
-                "--mock-abstracts", str(self.temp_dir / "sample_abstracts.json")
-            ]
+            cmd = [*self._cmd_base, "--config", config_file]
+            
+            # TORIR_ORCH_CACHE=1 の場合のみ、入力・設定・ソースが前回と同じなら保存済みの実行結果を再利用
+            cache_path = None
+            if os.environ.get("TORIR_ORCH_CACHE") == "1":
+                cache_path = self._orchestrator_cache_path(config_file)
+                cached = self._load_cached_orchestrator_result(cache_path)
+                if cached is not None:
+                    logger.info(f"Using cached orchestrator result: {cache_path}")
+                    return cached
+                outputs_before = self._snapshot_outputs()
             
             logger.info(f"Running orchestrator: {' '.join(cmd)}")
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5分タイムアウト
-                cwd=Path.cwd()
-            )
+            # 出力はメモリに溜めずログファイルへ直接書き出し、結果には末尾だけを残す
+            stdout_log = self._log_dir / "orchestrator_stdout.log"
+            stderr_log = self._log_dir / "orchestrator_stderr.log"
+            with open(stdout_log, 'wb', buffering=65536) as out, \
+                    open(stderr_log, 'wb', buffering=65536) as err:
+                process = subprocess.Popen(cmd, stdout=out, stderr=err, cwd=self._cwd)
+                try:
+                    returncode = process.wait(timeout=300)  # 5分タイムアウト
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    raise
             
-            return {
-                "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "success": result.returncode == 0
+            orchestrator_result = {
+                "returncode": returncode,
+                "stdout": _read_tail(stdout_log),
+                "stderr": _read_tail(stderr_log),
+                "success": returncode == 0,
+                "stdout_log": str(stdout_log),
+                "stderr_log": str(stderr_log)
             }
+            if cache_path is not None and orchestrator_result["success"]:
+                # この実行で作成・更新された出力ファイルだけをキャッシュに記録
+                outputs = {name: stat for name, stat in self._snapshot_outputs().items()
+                           if outputs_before.get(name) != stat}
+                self._save_cached_orchestrator_result(cache_path, orchestrator_result, outputs)
+            return orchestrator_result
             
         except subprocess.TimeoutExpired:
             return {
@@ -207,6 +364,79 @@ class OrchestratorIntegrationTester:
                 "success": False
             }
     
+    def _orchestrator_cache_path(self, config_file: str) -> Path:
+        """
+        オーケストレーター実行結果のキャッシュパスを取得
+        
+        テスト入力（CSV・アブストラクト・設定・キーワード）とsrc配下の
+        ソースの内容からキーを作るため、いずれかが変われば再実行される。
+        """
+        key = hashlib.blake2b(digest_size=16)
+        inputs = [
+            self._csv_path,
+            self._abstracts_path,
+            Path(config_file),
+            self.test_data_dir / "scoring_keywords.json",
+            *sorted(Path("src").glob("*.py"))
+        ]
+        for path in inputs:
+            key.update(str(path).encode("utf-8"))
+            try:
+                key.update(path.read_bytes())
+            except FileNotFoundError:
+                pass
+        return self.output_dir / "orch_cache" / f"{key.hexdigest()}.json"
+    
+    def _snapshot_outputs(self) -> Dict[str, List[int]]:
+        """processed配下のJSONファイルのサイズと更新時刻（ファイル名をキーとする）"""
+        outputs = {}
+        try:
+            with os.scandir(self._processed_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        stat = entry.stat()
+                        outputs[entry.name] = [stat.st_size, stat.st_mtime_ns]
+        except FileNotFoundError:
+            pass
+        return outputs
+    
+    def _load_cached_orchestrator_result(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        キャッシュ済みの実行結果を読み込み
+        
+        キャッシュした実行が作成した出力ファイルがすべて同じサイズ・更新時刻で
+        残っている場合のみ使用する（1つでも欠けていれば再実行）。
+        """
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            result = entry["result"]
+            outputs = entry["output_files"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable orchestrator cache {cache_path}: {e}")
+            return None
+        if not outputs:
+            return None
+        current = self._snapshot_outputs()
+        for name, stat in outputs.items():
+            if current.get(name) != stat:
+                logger.info(f"Orchestrator cache is stale ({name} changed or missing), re-running")
+                return None
+        result["cached"] = True
+        return result
+    
+    def _save_cached_orchestrator_result(self, cache_path: Path, result: Dict[str, Any],
+                                         outputs: Dict[str, List[int]]):
+        """成功した実行結果と、その実行が作成した出力ファイルの情報をキャッシュに保存"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                f.write(_dumps({"result": result, "output_files": outputs}, indent=False))
+        except OSError as e:
+            logger.warning(f"Failed to save orchestrator cache {cache_path}: {e}")
+    
     def analyze_results(self, orchestrator_result: Dict[str, Any]) -> Dict[str, Any]:
         """実行結果を分析"""
         analysis = {
@@ -218,25 +448,39 @@ class OrchestratorIntegrationTester:
         
         try:
             # 出力ファイルを確認
-            processed_dir = self.temp_dir / "processed"
-            if processed_dir.exists():
-                for file_path in processed_dir.glob("*.json"):
+            processed_dir = self._processed_dir
+            # exists()とglob()で何度もstatしないよう、scandirの1回の走査で対象とサイズを取得
+            try:
+                with os.scandir(processed_dir) as it:
+                    entries = [entry for entry in it
+                               if entry.name.endswith(".json") and not entry.name.startswith(".")
+                               and entry.is_file()]
+            except FileNotFoundError:
+                entries = []
+            
+            def _scan(entry: os.DirEntry):
+                # ファイル内容を読み込み（集計はメインスレッドで行う）
+                file_path = Path(entry.path)
+                try:
+                    size_bytes = entry.stat().st_size
+                    if size_bytes == 0:
+                        raise ValueError("empty file")
+                    info = _summarize_json(file_path)
+                    info["bytes"] = size_bytes
+                    return file_path, info, None
+                except Exception as e:
+                    return file_path, None, e
+            
+            with ThreadPoolExecutor(max_workers=min(16, len(entries) or 1)) as executor:
+                for file_path, info, error in executor.map(_scan, entries):
                     analysis["output_files"].append(str(file_path))
-                    
-                    # ファイル内容を読み込み
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        analysis["processed_data"][file_path.name] = {
-                            "type": "json",
-                            "size": len(data) if isinstance(data, list) else 1,
-                            "keys": list(data.keys()) if isinstance(data, dict) else None
-                        }
-                    except Exception as e:
-                        analysis["errors"].append(f"Failed to read {file_path}: {e}")
+                    if error is None:
+                        analysis["processed_data"][file_path.name] = info
+                    else:
+                        analysis["errors"].append(f"Failed to read {file_path}: {error}")
             
             # ログファイルを確認
-            log_file = self.temp_dir / "logs" / "orchestrator_test.log"
+            log_file = self._log_dir / "orchestrator_test.log"
             if log_file.exists():
                 analysis["log_file"] = str(log_file)
             
@@ -249,6 +493,16 @@ class OrchestratorIntegrationTester:
         
         return analysis
     
+    def _begin_step(self, name: str) -> Dict[str, Any]:
+        """ワークフローステップを実行中として記録し、そのステップを返す"""
+        step = {
+            "step": name,
+            "status": "running",
+            "timestamp_ns": time.time_ns()
+        }
+        self.results["workflow_steps"].append(step)
+        return step
+    
     def run_test(self) -> Dict[str, Any]:
         """統合テストを実行"""
         start_time = datetime.now()
@@ -258,48 +512,32 @@ class OrchestratorIntegrationTester:
         
         try:
             # 1. テスト環境のセットアップ
-            self.results["workflow_steps"].append({
-                "step": "setup_environment",
-                "status": "running",
-                "timestamp": datetime.now().isoformat()
-            })
+            step = self._begin_step("setup_environment")
             
             if not self.setup_test_environment():
                 raise Exception("Failed to setup test environment")
             
-            self.results["workflow_steps"][-1]["status"] = "completed"
+            step["status"] = "completed"
             
             # 2. テスト設定ファイルの作成
-            self.results["workflow_steps"].append({
-                "step": "create_config",
-                "status": "running",
-                "timestamp": datetime.now().isoformat()
-            })
+            step = self._begin_step("create_config")
             
             config_file = self.create_test_config()
-            self.results["workflow_steps"][-1]["status"] = "completed"
+            step["status"] = "completed"
             
             # 3. オーケストレーターの実行
-            self.results["workflow_steps"].append({
-                "step": "run_orchestrator",
-                "status": "running",
-                "timestamp": datetime.now().isoformat()
-            })
+            step = self._begin_step("run_orchestrator")
             
             orchestrator_result = self.run_orchestrator_with_mock(config_file)
             self.results["component_results"]["orchestrator"] = orchestrator_result
-            self.results["workflow_steps"][-1]["status"] = "completed"
+            step["status"] = "completed"
             
             # 4. 結果の分析
-            self.results["workflow_steps"].append({
-                "step": "analyze_results",
-                "status": "running",
-                "timestamp": datetime.now().isoformat()
-            })
+            step = self._begin_step("analyze_results")
             
             analysis = self.analyze_results(orchestrator_result)
             self.results["final_results"] = analysis
-            self.results["workflow_steps"][-1]["status"] = "completed"
+            step["status"] = "completed"
             
             # 終了時間を記録
             end_time = datetime.now()
@@ -315,8 +553,27 @@ class OrchestratorIntegrationTester:
             self.results["errors"].append({"error": str(e)})
             raise
     
-    def save_results(self, output_file: str = None) -> str:
-        """結果をJSONファイルに保存"""
+    def _results_for_output(self) -> Dict[str, Any]:
+        """保存用の結果を作成（ステップのtimestamp_nsをISO形式のtimestampに変換）"""
+        workflow_steps = []
+        for step in self.results["workflow_steps"]:
+            step = dict(step)
+            timestamp_ns = step.pop("timestamp_ns", None)
+            if timestamp_ns is not None:
+                seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+                step["timestamp"] = datetime.fromtimestamp(seconds).replace(
+                    microsecond=nanos // 1000).isoformat()
+            workflow_steps.append(step)
+        return {**self.results, "workflow_steps": workflow_steps}
+    
+    def save_results(self, output_file: str = None, compact: bool = False) -> str:
+        """
+        結果をJSONファイルに保存
+        
+        Args:
+            output_file: 出力ファイルパス（省略時はタイムスタンプ付きのファイル名）
+            compact: Trueの場合はインデントなしのコンパクト形式で保存
+        """
         if output_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = self.output_dir / f"orchestrator_integration_test_{timestamp}.json"
@@ -324,8 +581,9 @@ class OrchestratorIntegrationTester:
             output_file = Path(output_file)
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.results, f, ensure_ascii=False, indent=2)
+            with open(output_file, 'wb') as f:
+                # バイト列にしてから一度に書き込む
+                f.write(_dumps(self._results_for_output(), indent=not compact))
             
             logger.info(f"Results saved to: {output_file}")
             return str(output_file)
@@ -339,53 +597,83 @@ class OrchestratorIntegrationTester:
         test_info = self.results["test_info"]
         final_results = self.results.get("final_results", {})
         
-        print("\n" + "="*60)
-        print("Orchestrator Integration Test Results")
-        print("="*60)
-        
-        print(f"Test Duration: {test_info.get('duration', 'N/A')}")
-        print(f"Orchestrator Success: {final_results.get('orchestrator_success', 'N/A')}")
-        print(f"Output Files: {len(final_results.get('output_files', []))}")
+        # 1行ずつprintせず、まとめて一度に書き出す
+        lines = [
+            "\n" + "="*60,
+            "Orchestrator Integration Test Results",
+            "="*60,
+            f"Test Duration: {test_info.get('duration', 'N/A')}",
+            f"Orchestrator Success: {final_results.get('orchestrator_success', 'N/A')}",
+            f"Output Files: {len(final_results.get('output_files', []))}"
+        ]
         
         if final_results.get("output_files"):
-            print(f"\nGenerated Files:")
-            for file_path in final_results["output_files"]:
-                print(f"  - {Path(file_path).name}")
+            lines.append(f"\nGenerated Files:")
+            lines.extend(f"  - {Path(file_path).name}" for file_path in final_results["output_files"])
         
         if final_results.get("processed_data"):
-            print(f"\nProcessed Data:")
-            for file_name, data_info in final_results["processed_data"].items():
-                print(f"  - {file_name}: {data_info['type']}, size={data_info['size']}")
+            lines.append(f"\nProcessed Data:")
+            lines.extend(f"  - {file_name}: {data_info['type']}, size={data_info['size']}"
+                         for file_name, data_info in final_results["processed_data"].items())
         
         if final_results.get("errors"):
-            print(f"\nErrors ({len(final_results['errors'])}):")
-            for error in final_results["errors"][:3]:  # 最初の3件のみ表示
-                print(f"  - {error}")
+            lines.append(f"\nErrors ({len(final_results['errors'])}):")
+            # 最初の3件のみ表示
+            lines.extend(f"  - {error}" for error in islice(final_results["errors"], 3))
         
         # ワークフローステップの状況
-        print(f"\nWorkflow Steps:")
+        lines.append(f"\nWorkflow Steps:")
         for step in self.results.get("workflow_steps", []):
             status_icon = "✓" if step["status"] == "completed" else "✗"
-            print(f"  {status_icon} {step['step']}: {step['status']}")
+            lines.append(f"  {status_icon} {step['step']}: {step['status']}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def cleanup(self):
-        """一時ファイルのクリーンアップ"""
+        """
+        一時ファイルのクリーンアップ
+        
+        一時ディレクトリを退避名にリネームしてから、削除はバックグラウンドスレッドで行う。
+        デーモンスレッドはインタプリタ終了時に中断されるため、前回までに削除しきれなかった
+        退避ディレクトリ（temp.deleting.*）もここでまとめて削除する。
+        完了を待つ場合はwait_cleanupを呼ぶ。
+        """
         try:
             if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
-                logger.info(f"Cleaned up temp directory: {self.temp_dir}")
+                # リネームは即座に終わるため、途中で終了しても temp 自体は残らない
+                trash_dir = self.temp_dir.with_name(f"{self.temp_dir.name}.deleting.{os.getpid()}.{time.time_ns()}")
+                self.temp_dir.rename(trash_dir)
+                logger.info(f"Cleaning up temp directory in background: {self.temp_dir}")
+            trash_dirs = list(self.temp_dir.parent.glob(f"{self.temp_dir.name}.deleting.*"))
+            if trash_dirs:
+                self._cleanup_thread = threading.Thread(
+                    target=_remove_dirs,
+                    args=(trash_dirs,),
+                    daemon=True
+                )
+                self._cleanup_thread.start()
         except Exception as e:
             logger.warning(f"Failed to cleanup temp directory: {e}")
+    
+    def wait_cleanup(self, timeout: float = 5):
+        """バックグラウンドのクリーンアップ完了を待つ"""
+        cleanup_thread = getattr(self, "_cleanup_thread", None)
+        if cleanup_thread is not None:
+            cleanup_thread.join(timeout=timeout)
 
 def main():
     """メイン関数"""
-    if len(sys.argv) < 2:
-        print("Usage: python test_orchestrator_integration.py <test_data_dir> [output_dir]")
+    # --compact: 結果ファイルをインデントなしで保存
+    compact = "--compact" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--compact"]
+    
+    if len(args) < 1:
+        print("Usage: python test_orchestrator_integration.py <test_data_dir> [output_dir] [--compact]")
         print("Example: python test_orchestrator_integration.py ../data/test_data")
         sys.exit(1)
     
-    test_data_dir = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else "test_output"
+    test_data_dir = args[0]
+    output_dir = args[1] if len(args) > 1 else "test_output"
     
     # テストデータディレクトリの存在確認
     if not Path(test_data_dir).exists():
@@ -397,7 +685,7 @@ def main():
     
     try:
         results = tester.run_test()
-        tester.save_results()
+        tester.save_results(compact=compact)
         tester.display_summary()
         
         # 終了コード
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test Relevance Scorer - スコア付きデータの並び順と統計の仕様を確認するテスト
+
+calculate_relevance_scores は入力と同じ順序で返し（NaNスコアも元の位置のまま）、
+スコア上位の取得は top_k、統計は NaN を除外して計算することを確認します。
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# src配下のモジュールをインポート
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from relevance_scorer import RelevanceScorer
+
+# テスト用のキーワード設定
+KEYWORDS_CONFIG = {
+    "categories": {
+        "high": {"weight": 2.0, "keywords": ["vagus nerve", "biosensor"]},
+        "low": {"weight": 0.5, "keywords": ["device"]}
+    }
+}
+
+# 入力順（NaNになる特許を先頭と途中に置く）
+PATENTS = [
+    {"id": "P0", "title": "no abstract", "abstract": None},
+    {"id": "P1", "title": "device", "abstract": "a device"},
+    {"id": "P2", "title": "vagus nerve", "abstract": "biosensor device"},
+    {"id": "P3", "title": "blank abstract", "abstract": "   "},
+    {"id": "P4", "title": "unrelated", "abstract": "nothing relevant"},
+    {"id": "P5", "title": "vagus nerve", "abstract": "stimulation"}
+]
+
+
+class RelevanceScorerOrderTest(unittest.TestCase):
+    """スコア付きデータの並び順・上位取得・統計のテスト"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        config_path = os.path.join(self.temp_dir.name, "scoring_keywords.json")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(KEYWORDS_CONFIG, f)
+        self.scorer = RelevanceScorer(config_path)
+        self.patents = [dict(patent) for patent in PATENTS]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_scores_keep_input_order(self):
+        """NaNスコアも含めて入力と同じ順序で返す（ソートしない）"""
+        scored = self.scorer.calculate_relevance_scores(self.patents)
+        self.assertIs(scored, self.patents)
+        self.assertEqual([p["id"] for p in scored], [p["id"] for p in PATENTS])
+        self.assertTrue(math.isnan(scored[0]["relevance_score"]))
+        self.assertTrue(math.isnan(scored[3]["relevance_score"]))
+        self.assertEqual([scored[i]["relevance_score"] for i in (1, 2, 4, 5)], [5, 45, 0, 20])
+
+    def test_top_k_is_descending_without_nan(self):
+        """top_kはNaNを除いたスコア降順の上位k件"""
+        scored = self.scorer.calculate_relevance_scores(self.patents)
+        self.assertEqual([p["id"] for p in self.scorer.top_k(scored, 3)], ["P2", "P5", "P1"])
+        self.assertEqual(len(self.scorer.top_k(scored)), 4)
+
+    def test_statistics_exclude_nan(self):
+        """統計はNaNスコアを除外して計算（total_patentsは全件）"""
+        stats = self.scorer.get_score_statistics(self.scorer.calculate_relevance_scores(self.patents))
+        self.assertEqual(stats["total_patents"], 6)
+        self.assertEqual(stats["max_score"], 45)
+        self.assertEqual(stats["min_score"], 0)
+        self.assertEqual(stats["average_score"], 17.5)
+        self.assertEqual(stats["zero_score_count"], 1)
+        self.assertEqual(stats["high_score_count"], 2)
+
+    def test_saved_file_keeps_input_order(self):
+        """保存したファイルも入力順（NaNはNaNのまま書き出す）"""
+        scored = self.scorer.calculate_relevance_scores(self.patents)
+        output_path = os.path.join(self.temp_dir.name, "scored.json")
+        self.scorer.save_scored_data(scored, output_path)
+        with open(output_path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        self.assertEqual([p["id"] for p in saved], [p["id"] for p in PATENTS])
+        self.assertTrue(math.isnan(saved[0]["relevance_score"]))
+
+
+if __name__ == "__main__":
+    unittest.main()